@@ -1,7 +1,5 @@
 """Allow running with: python -m backend.api"""
 
-from backend.api.main import app  # noqa: F401
-
 if __name__ == "__main__":
     import atexit
     import signal
@@ -23,6 +21,18 @@ if __name__ == "__main__":
     signal.signal(signal.SIGTERM, _signal_handler)
     atexit.register(_cleanup)
 
-    settings.ensure_dirs()
-    db.initialize()
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    # Before any API worker starts, so no live report job can be swept
+    db.fail_interrupted_reports()
+    db.close()
+
+    uvicorn.run(
+        # Import string: uvicorn loads the app itself, once per worker process
+        "backend.api.main:app",
+        host=settings.host,
+        port=settings.port,
+        loop=settings.event_loop,
+        http="httptools",
+        workers=settings.api_workers,
+        limit_concurrency=settings.limit_concurrency,
+        timeout_keep_alive=settings.timeout_keep_alive,
+    )
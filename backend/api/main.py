@@ -2,16 +2,53 @@
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 
-from backend.api.routes import batches, dashboard, documents, reports
+from backend.api.responses import FrontendStaticFiles
+from backend.core.config import settings
 from backend.core.database import db
 
-app = FastAPI(title="RedactQC API", version="0.1.0")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create data directories and the schema on startup; release resources on shutdown.
+
+    This is the only place the database is initialized when serving the API.
+    Presidio and spaCy are warmed up in a background thread, so the port
+    opens without waiting for them. On shutdown, worker pools and report
+    threads are terminated so nothing holds the port.
+    """
+    settings.ensure_dirs()
+    db.initialize()
+
+    from backend.processing.worker_pool import warm_up
+
+    app.state.warm_up = asyncio.create_task(asyncio.to_thread(warm_up))
+    yield
+
+    from backend.api.routes.reports import shutdown_report_executor
+    from backend.processing.worker_pool import shutdown_all_pools
+
+    shutdown_all_pools()
+    shutdown_report_executor()
+    await db.aclose()
+
+
+app = FastAPI(title="RedactQC API", version="0.1.0", lifespan=lifespan)
+
+# Middleware convention: only pure ASGI middleware (a class with
+# ``async def __call__(self, scope, receive, send)``, wrapping ``send`` to
+# observe status codes or headers). Do not subclass BaseHTTPMiddleware or use
+# @app.middleware("http"); both run every request through an extra task and
+# memory streams, which costs a large share of throughput.
 
 # CORS for localhost development (Vite dev server on port 5173)
 app.add_middleware(
@@ -27,25 +64,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Register route modules
-app.include_router(batches.router)
-app.include_router(documents.router)
-app.include_router(dashboard.router)
-app.include_router(reports.router)
-
-
-@app.on_event("startup")
-def startup() -> None:
-    """Initialize the database on startup."""
-    db.initialize()
+# Compress document/finding lists and CSV downloads. Middleware added last runs
+# outermost, so GZip wraps the CORS-decorated response.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
-
-@app.on_event("shutdown")
-def shutdown() -> None:
-    """Terminate any active worker pools so child processes don't hold the port."""
-    from backend.processing.worker_pool import shutdown_all_pools
-
-    shutdown_all_pools()
+# Register route modules. Each imports its own heavy dependencies (processing,
+# report generators) lazily, so only the ones a request needs are loaded.
+_ROUTE_MODULES = ("batches", "documents", "dashboard", "reports", "health")
+for _name in _ROUTE_MODULES:
+    app.include_router(importlib.import_module(f"backend.api.routes.{_name}").router)
 
 
 # Serve the built frontend if it exists.
@@ -58,4 +85,4 @@ else:
     _frontend_dist = Path(__file__).resolve().parent.parent.parent / "frontend" / "dist"
 
 if _frontend_dist.is_dir():
-    app.mount("/", StaticFiles(directory=str(_frontend_dist), html=True), name="frontend")
+    app.mount("/", FrontendStaticFiles(directory=str(_frontend_dist), html=True), name="frontend")
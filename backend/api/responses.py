@@ -0,0 +1,53 @@
+"""Custom response classes for the RedactQC API."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import PurePath
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+# Vite fingerprints bundle files as assets/<name>-<8 char hash>.<ext>.
+_HASHED_ASSET = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    For endpoints that return plain DB rows directly, skipping response-model
+    validation and the stdlib encoder on large payloads.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+class FrontendStaticFiles(StaticFiles):
+    """StaticFiles for the built SPA with long-lived caching of hashed assets.
+
+    Fingerprinted files under ``assets/`` never change content for a given
+    name, so browsers may keep them for a year. ``index.html`` must be
+    revalidated on every load so a new build's asset names are picked up;
+    Starlette's mtime+size ETag turns that revalidation into a 304.
+    """
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        path = PurePath(full_path)
+        if path.parent.name == "assets" and _HASHED_ASSET.search(path.name):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        elif path.suffix == ".html":
+            response.headers["Cache-Control"] = "no-cache"
+        return response
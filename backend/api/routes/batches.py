@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
-import uuid
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import anyio
 from fastapi import APIRouter, BackgroundTasks, HTTPException
 
 from backend.api.schemas.models import BatchDetail, BatchSummary, DocumentSummary, ScanRequest
+from backend.core.cache import stats_cache
 from backend.core.config import settings
 from backend.core.database import db
+from backend.core.ids import uuid7_hex
 
 router = APIRouter(prefix="/api", tags=["batches"])
 
@@ -40,27 +43,37 @@ def _start_batch_processing(batch_id: str) -> None:
             log.exception("Failed to mark batch %s as error", batch_id)
 
 
+def _scan_folder(source_path: str) -> tuple[str, list[tuple[str, str]]]:
+    """Resolve ``source_path`` and list the PDFs directly inside it.
+
+    Returns the resolved folder and ``(filename, filepath)`` pairs sorted by
+    filename. One directory read with a case-insensitive suffix check, so each
+    file is seen exactly once even on case-insensitive filesystems; entries
+    stay plain strings so no Path objects are built per file.
+    """
+    folder = os.fspath(Path(source_path).resolve(strict=True))
+    with os.scandir(folder) as entries:
+        pdf_files = sorted(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.name.lower().endswith(".pdf") and entry.is_file()
+        )
+    return folder, pdf_files
+
+
 @router.post("/scan", response_model=BatchSummary)
-def start_scan(req: ScanRequest, background_tasks: BackgroundTasks) -> BatchSummary:
+async def start_scan(req: ScanRequest, background_tasks: BackgroundTasks) -> BatchSummary:
     """Start a new batch scan of a folder of PDFs."""
-    folder = Path(req.source_path)
-    if not folder.is_dir():
+    # Directory reads can take seconds on network shares; keep them off the loop.
+    try:
+        folder, pdf_files = await anyio.to_thread.run_sync(_scan_folder, req.source_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise HTTPException(status_code=400, detail=f"Directory not found: {req.source_path}")
-
-    # Glob both cases, then deduplicate — on Windows the FS is case-insensitive
-    # so *.pdf and *.PDF return the same files.
-    seen: set[Path] = set()
-    pdf_files: list[Path] = []
-    for f in sorted(folder.glob("*.pdf")) + sorted(folder.glob("*.PDF")):
-        resolved = f.resolve()
-        if resolved not in seen:
-            seen.add(resolved)
-            pdf_files.append(f)
     if not pdf_files:
         raise HTTPException(status_code=400, detail="No PDF files found in the specified folder.")
 
-    batch_id = uuid.uuid4().hex
-    name = req.name or folder.name
+    batch_id = uuid7_hex()
+    name = req.name or os.path.basename(folder)
     created_at = datetime.now(timezone.utc).isoformat()
 
     # Apply optional overrides
@@ -69,29 +82,31 @@ def start_scan(req: ScanRequest, background_tasks: BackgroundTasks) -> BatchSumm
     if req.worker_count is not None:
         settings.worker_count = req.worker_count
 
-    with db.transaction() as conn:
-        conn.execute(
+    # Pre-create document records; built before BEGIN IMMEDIATE so the write
+    # lock is held only for the inserts.
+    doc_rows = [(uuid7_hex(), batch_id, filename, filepath) for filename, filepath in pdf_files]
+
+    async with db.async_transaction() as conn:
+        await conn.execute(
             "INSERT INTO batches (id, name, source_path, created_at, status, total_docs) "
             "VALUES (?, ?, ?, ?, 'pending', ?)",
-            (batch_id, name, str(folder), created_at, len(pdf_files)),
+            (batch_id, name, folder, created_at, len(pdf_files)),
         )
-
-        # Pre-create document records
-        doc_rows = []
-        for pdf_path in pdf_files:
-            doc_id = uuid.uuid4().hex
-            doc_rows.append((doc_id, batch_id, pdf_path.name, str(pdf_path)))
-        conn.executemany(
+        await conn.executemany(
             "INSERT INTO documents (id, batch_id, filename, filepath) VALUES (?, ?, ?, ?)",
             doc_rows,
         )
+        # Refresh planner statistics so the new rows are served by the
+        # (batch_id, ...) indexes; bounded by analysis_limit.
+        await conn.execute("ANALYZE documents")
+    stats_cache.invalidate()
 
     background_tasks.add_task(_start_batch_processing, batch_id)
 
     return BatchSummary(
         id=batch_id,
         name=name,
-        source_path=str(folder),
+        source_path=folder,
         created_at=created_at,
         status="pending",
         total_docs=len(pdf_files),
@@ -101,39 +116,40 @@ def start_scan(req: ScanRequest, background_tasks: BackgroundTasks) -> BatchSumm
 
 
 @router.get("/batches", response_model=list[BatchSummary])
-def list_batches() -> list[BatchSummary]:
+async def list_batches() -> list[BatchSummary]:
     """List all batches sorted by creation time (newest first)."""
-    with db.get_connection() as conn:
-        rows = conn.execute(
+    async with db.async_connection() as conn:
+        rows = await conn.execute_fetchall(
             "SELECT id, name, source_path, created_at, status, "
             "total_docs, processed_docs, docs_with_findings "
             "FROM batches ORDER BY created_at DESC"
-        ).fetchall()
-    return [BatchSummary(**dict(r)) for r in rows]
+        )
+    return [BatchSummary.model_construct(**dict(r)) for r in rows]
 
 
 @router.get("/batches/{batch_id}", response_model=BatchDetail)
-def get_batch(batch_id: str) -> BatchDetail:
+async def get_batch(batch_id: str) -> BatchDetail:
     """Get batch detail including its documents."""
-    with db.get_connection() as conn:
-        row = conn.execute(
+    async with db.async_connection() as conn:
+        cursor = await conn.execute(
             "SELECT id, name, source_path, created_at, status, "
             "total_docs, processed_docs, docs_with_findings "
             "FROM batches WHERE id = ?",
             (batch_id,),
-        ).fetchone()
+        )
+        row = await cursor.fetchone()
         if row is None:
             raise HTTPException(status_code=404, detail="Batch not found")
 
-        doc_rows = conn.execute(
+        doc_rows = await conn.execute_fetchall(
             "SELECT id, batch_id, filename, page_count, status, finding_count, processed_at "
             "FROM documents WHERE batch_id = ? ORDER BY filename",
             (batch_id,),
-        ).fetchall()
+        )
 
-    return BatchDetail(
+    return BatchDetail.model_construct(
         **dict(row),
-        documents=[DocumentSummary(**dict(d)) for d in doc_rows],
+        documents=[DocumentSummary.model_construct(**dict(d)) for d in doc_rows],
     )
 
 
@@ -146,6 +162,7 @@ def delete_batch(batch_id: str) -> dict[str, str]:
             raise HTTPException(status_code=404, detail="Batch not found")
         # CASCADE handles documents and findings
         conn.execute("DELETE FROM batches WHERE id = ?", (batch_id,))
+    stats_cache.invalidate()
     return {"status": "deleted", "batch_id": batch_id}
 
 
@@ -155,4 +172,5 @@ def delete_all_batches() -> dict[str, str]:
     with db.transaction() as conn:
         count = conn.execute("SELECT COUNT(*) as cnt FROM batches").fetchone()["cnt"]
         conn.execute("DELETE FROM batches")
+    stats_cache.invalidate()
     return {"status": "deleted", "count": str(count)}
@@ -2,59 +2,80 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Request, Response
 
 from backend.api.schemas.models import PIITypeCount, StatsResponse
+from backend.core.cache import CachedPayload, stats_cache
 from backend.core.database import db
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
 
 
+def _conditional_response(request: Request, cached: CachedPayload) -> Response:
+    """Return 304 when the client already holds this payload, else the JSON body."""
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == cached.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
 @router.get("/stats", response_model=StatsResponse)
-def get_stats() -> StatsResponse:
+async def get_stats(request: Request) -> Response:
     """Global statistics across all batches."""
-    with db.get_connection() as conn:
-        batch_count = conn.execute(
-            "SELECT COUNT(*) as cnt FROM batches"
-        ).fetchone()["cnt"]
-
-        doc_row = conn.execute(
-            "SELECT COUNT(*) as cnt, "
-            "COALESCE(SUM(CASE WHEN finding_count > 0 THEN 1 ELSE 0 END), 0) as with_findings "
-            "FROM documents"
-        ).fetchone()
-
-        finding_count = conn.execute(
-            "SELECT COUNT(*) as cnt FROM findings"
-        ).fetchone()["cnt"]
-
-        pii_rows = conn.execute(
-            "SELECT pii_type, COUNT(*) as cnt FROM findings GROUP BY pii_type ORDER BY cnt DESC"
-        ).fetchall()
-
-    return StatsResponse(
-        total_batches=batch_count,
-        total_documents=doc_row["cnt"],
-        total_findings=finding_count,
-        docs_with_findings=doc_row["with_findings"],
-        pii_type_counts={row["pii_type"]: row["cnt"] for row in pii_rows},
-    )
+    cached = stats_cache.get("stats")
+    if cached is None:
+        generation = stats_cache.generation
+        async with db.async_connection() as conn:
+            cursor = await conn.execute("SELECT COUNT(*) as cnt FROM batches")
+            batch_count = (await cursor.fetchone())["cnt"]
+
+            cursor = await conn.execute(
+                "SELECT COUNT(*) as cnt, "
+                "COALESCE(SUM(CASE WHEN finding_count > 0 THEN 1 ELSE 0 END), 0) as with_findings "
+                "FROM documents"
+            )
+            doc_row = await cursor.fetchone()
+
+            cursor = await conn.execute("SELECT COUNT(*) as cnt FROM findings")
+            finding_count = (await cursor.fetchone())["cnt"]
+
+            pii_rows = await conn.execute_fetchall(
+                "SELECT pii_type, COUNT(*) as cnt FROM findings GROUP BY pii_type ORDER BY cnt DESC"
+            )
+
+        stats = {
+            "total_batches": batch_count,
+            "total_documents": doc_row["cnt"],
+            "total_findings": finding_count,
+            "docs_with_findings": doc_row["with_findings"],
+            "pii_type_counts": {row["pii_type"]: row["cnt"] for row in pii_rows},
+        }
+        cached = stats_cache.set("stats", orjson.dumps(stats), generation)
+
+    return _conditional_response(request, cached)
 
 
 @router.get("/pii-types", response_model=list[PIITypeCount])
-def get_pii_types() -> list[PIITypeCount]:
+async def get_pii_types(request: Request) -> Response:
     """PII type breakdown with counts and average confidence."""
-    with db.get_connection() as conn:
-        rows = conn.execute(
-            "SELECT pii_type, COUNT(*) as count, AVG(confidence) as avg_confidence "
-            "FROM findings GROUP BY pii_type ORDER BY count DESC"
-        ).fetchall()
-
-    return [
-        PIITypeCount(
-            pii_type=row["pii_type"],
-            count=row["count"],
-            avg_confidence=round(row["avg_confidence"], 4),
-        )
-        for row in rows
-    ]
+    cached = stats_cache.get("pii-types")
+    if cached is None:
+        generation = stats_cache.generation
+        async with db.async_connection() as conn:
+            rows = await conn.execute_fetchall(
+                "SELECT pii_type, COUNT(*) as count, AVG(confidence) as avg_confidence "
+                "FROM findings GROUP BY pii_type ORDER BY count DESC"
+            )
+
+        pii_types = [
+            {
+                "pii_type": row["pii_type"],
+                "count": row["count"],
+                "avg_confidence": round(row["avg_confidence"], 4),
+            }
+            for row in rows
+        ]
+        cached = stats_cache.set("pii-types", orjson.dumps(pii_types), generation)
+
+    return _conditional_response(request, cached)
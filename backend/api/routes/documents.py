@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import base64
+import json
+import sqlite3
+from functools import cache
+from typing import Literal, get_args
+
+import aiosqlite
 from fastapi import APIRouter, HTTPException, Query
 
+from backend.api.responses import ORJSONResponse
 from backend.api.schemas.models import (
     DocumentDetail,
     DocumentSummary,
@@ -14,69 +22,145 @@ from backend.core.database import db
 
 router = APIRouter(prefix="/api", tags=["documents"])
 
+# Column order of the finding SELECTs below; zipping a row against it drops
+# any trailing helper column such as _total.
+_FINDING_COLUMNS = (
+    "id",
+    "document_id",
+    "page_number",
+    "pii_type",
+    "confidence",
+    "context_snippet",
+    "char_offset",
+    "char_length",
+)
+
+
+async def _page_total(
+    conn: aiosqlite.Connection,
+    rows: list[sqlite3.Row],
+    offset: int,
+    count_sql: str,
+    params: list[object],
+) -> int:
+    """Total row count for a page selected with ``COUNT(*) OVER () AS _total``.
+
+    Only a page past the end (no rows to carry the total) costs an extra query.
+    """
+    if rows:
+        return rows[0]["_total"]
+    if not offset:
+        return 0
+    cursor = await conn.execute(count_sql, params)
+    return (await cursor.fetchone())["cnt"]
+
+
+def _encode_cursor(row: sqlite3.Row) -> str:
+    """Opaque keyset cursor for the finding sort key (page_number, char_offset, id)."""
+    key = [row["page_number"], row["char_offset"], row["id"]]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[int, int, int]:
+    try:
+        page_number, char_offset, finding_id = json.loads(base64.urlsafe_b64decode(cursor))
+        return int(page_number), int(char_offset), int(finding_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
+DocumentSortKey = Literal["filename", "status", "finding_count", "processed_at"]
+SortOrder = Literal["asc", "desc"]
+
+_DOCUMENT_ORDER_SQL: dict[tuple[str, str], str] = {
+    (key, order): f"ORDER BY d.{key} {order.upper()}"
+    for key in get_args(DocumentSortKey)
+    for order in get_args(SortOrder)
+}
+
+
+@cache
+def _documents_query(
+    has_findings: bool | None,
+    by_pii_type: bool,
+    by_min_confidence: bool,
+    sort_by: str,
+    sort_order: str,
+) -> tuple[str, str]:
+    """Build the (page, count) SQL for one combination of list_documents filters.
+
+    Parameters bind in order: batch_id, then pii_type and min_confidence when
+    present; the page query adds LIMIT and OFFSET.
+    """
+    conditions = ["d.batch_id = ?"]
+    if has_findings is True:
+        conditions.append("d.finding_count > 0")
+    elif has_findings is False:
+        conditions.append("d.finding_count = 0")
+
+    # One correlated EXISTS probe per document, served by the
+    # (document_id, pii_type, confidence) index on findings
+    finding_conditions = []
+    if by_pii_type:
+        finding_conditions.append("f.pii_type = ?")
+    if by_min_confidence:
+        finding_conditions.append("f.confidence >= ?")
+    if finding_conditions:
+        conditions.append(
+            "EXISTS (SELECT 1 FROM findings f WHERE f.document_id = d.id AND "
+            + " AND ".join(finding_conditions)
+            + ")"
+        )
+
+    where_clause = " AND ".join(conditions)
+    # COUNT(*) OVER () returns the unpaginated total alongside the page.
+    page_sql = (
+        "SELECT d.id, d.batch_id, d.filename, d.page_count, d.status, "
+        "d.finding_count, d.processed_at, COUNT(*) OVER () AS _total "
+        f"FROM documents d WHERE {where_clause} "  # noqa: S608
+        f"{_DOCUMENT_ORDER_SQL[sort_by, sort_order]} LIMIT ? OFFSET ?"
+    )
+    count_sql = f"SELECT COUNT(*) as cnt FROM documents d WHERE {where_clause}"  # noqa: S608
+    return page_sql, count_sql
+
 
 @router.get(
     "/batches/{batch_id}/documents",
     response_model=PaginatedResponse[DocumentSummary],
 )
-def list_documents(
+async def list_documents(
     batch_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=500),
-    sort_by: str = Query("filename", pattern=r"^(filename|status|finding_count|processed_at)$"),
-    sort_order: str = Query("asc", pattern=r"^(asc|desc)$"),
+    sort_by: DocumentSortKey = "filename",
+    sort_order: SortOrder = "asc",
     pii_type: str | None = None,
     min_confidence: float | None = None,
     has_findings: bool | None = None,
 ) -> PaginatedResponse[DocumentSummary]:
     """List documents in a batch with pagination and optional filters."""
-    with db.get_connection() as conn:
+    async with db.async_connection() as conn:
         # Verify batch exists
-        batch = conn.execute("SELECT id FROM batches WHERE id = ?", (batch_id,)).fetchone()
+        cursor = await conn.execute("SELECT id FROM batches WHERE id = ?", (batch_id,))
+        batch = await cursor.fetchone()
         if batch is None:
             raise HTTPException(status_code=404, detail="Batch not found")
 
-        conditions = ["d.batch_id = ?"]
         params: list[object] = [batch_id]
-
-        if has_findings is True:
-            conditions.append("d.finding_count > 0")
-        elif has_findings is False:
-            conditions.append("d.finding_count = 0")
-
         if pii_type is not None:
-            conditions.append(
-                "d.id IN (SELECT DISTINCT document_id FROM findings WHERE pii_type = ?)"
-            )
             params.append(pii_type)
-
         if min_confidence is not None:
-            conditions.append(
-                "d.id IN (SELECT DISTINCT document_id FROM findings WHERE confidence >= ?)"
-            )
             params.append(min_confidence)
+        page_sql, count_sql = _documents_query(
+            has_findings, pii_type is not None, min_confidence is not None, sort_by, sort_order
+        )
 
-        where_clause = " AND ".join(conditions)
-
-        # Total count
-        total = conn.execute(
-            f"SELECT COUNT(*) as cnt FROM documents d WHERE {where_clause}",  # noqa: S608
-            params,
-        ).fetchone()["cnt"]
-
-        # Column name is validated by the regex on sort_by, safe for interpolation
         offset = (page - 1) * page_size
-        rows = conn.execute(
-            f"SELECT d.id, d.batch_id, d.filename, d.page_count, d.status, "  # noqa: S608
-            f"d.finding_count, d.processed_at "
-            f"FROM documents d WHERE {where_clause} "
-            f"ORDER BY d.{sort_by} {sort_order} "
-            f"LIMIT ? OFFSET ?",
-            [*params, page_size, offset],
-        ).fetchall()
-
-    return PaginatedResponse[DocumentSummary](
-        items=[DocumentSummary(**dict(r)) for r in rows],
+        rows = await conn.execute_fetchall(page_sql, [*params, page_size, offset])
+        total = await _page_total(conn, rows, offset, count_sql, params)
+
+    return PaginatedResponse[DocumentSummary].model_construct(
+        items=[DocumentSummary.model_construct(**dict(r)) for r in rows],
         total=total,
         page=page,
         page_size=page_size,
@@ -84,44 +168,57 @@ def list_documents(
 
 
 @router.get("/documents/{document_id}", response_model=DocumentDetail)
-def get_document(document_id: str) -> DocumentDetail:
-    """Get document detail with all findings."""
-    with db.get_connection() as conn:
-        doc = conn.execute(
+async def get_document(document_id: str) -> ORJSONResponse:
+    """Get document detail with all findings.
+
+    Rows come straight from our own schema, so they are serialized with orjson
+    without building a response model per finding.
+    """
+    async with db.async_connection() as conn:
+        cursor = await conn.execute(
             "SELECT id, batch_id, filename, page_count, status, finding_count, processed_at "
             "FROM documents WHERE id = ?",
             (document_id,),
-        ).fetchone()
+        )
+        doc = await cursor.fetchone()
         if doc is None:
             raise HTTPException(status_code=404, detail="Document not found")
 
-        finding_rows = conn.execute(
+        finding_rows = await conn.execute_fetchall(
             "SELECT id, document_id, page_number, pii_type, confidence, "
             "context_snippet, char_offset, char_length "
             "FROM findings WHERE document_id = ? ORDER BY page_number, char_offset",
             (document_id,),
-        ).fetchall()
+        )
 
-    return DocumentDetail(
+    return ORJSONResponse({
         **dict(doc),
-        findings=[Finding(**dict(f)) for f in finding_rows],
-    )
+        "findings": [dict(zip(_FINDING_COLUMNS, f)) for f in finding_rows],
+    })
 
 
 @router.get(
     "/documents/{document_id}/findings",
     response_model=PaginatedResponse[Finding],
 )
-def list_findings(
+async def list_findings(
     document_id: str,
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=500),
     pii_type: str | None = None,
     min_confidence: float | None = None,
-) -> PaginatedResponse[Finding]:
-    """List findings for a document with optional filters."""
-    with db.get_connection() as conn:
-        doc = conn.execute("SELECT id FROM documents WHERE id = ?", (document_id,)).fetchone()
+    cursor: str | None = None,
+) -> ORJSONResponse:
+    """List findings for a document with optional filters.
+
+    Pass the previous response's ``next_cursor`` as ``cursor`` to page by key
+    instead of OFFSET, so deep pages cost the same as the first one.
+    """
+    after = _decode_cursor(cursor) if cursor is not None else None
+
+    async with db.async_connection() as conn:
+        doc_cursor = await conn.execute("SELECT id FROM documents WHERE id = ?", (document_id,))
+        doc = await doc_cursor.fetchone()
         if doc is None:
             raise HTTPException(status_code=404, detail="Document not found")
 
@@ -137,25 +234,41 @@ def list_findings(
             params.append(min_confidence)
 
         where_clause = " AND ".join(conditions)
+        count_sql = f"SELECT COUNT(*) as cnt FROM findings WHERE {where_clause}"  # noqa: S608
 
-        total = conn.execute(
-            f"SELECT COUNT(*) as cnt FROM findings WHERE {where_clause}",  # noqa: S608
-            params,
-        ).fetchone()["cnt"]
+        # One extra row tells us whether a next page exists
+        if after is None:
+            offset = (page - 1) * page_size
+            rows = await conn.execute_fetchall(
+                f"SELECT id, document_id, page_number, pii_type, confidence, "  # noqa: S608
+                f"context_snippet, char_offset, char_length, COUNT(*) OVER () AS _total "
+                f"FROM findings WHERE {where_clause} "
+                f"ORDER BY page_number, char_offset, id "
+                f"LIMIT ? OFFSET ?",
+                [*params, page_size + 1, offset],
+            )
+            total = await _page_total(conn, rows, offset, count_sql, params)
+        else:
+            # The window total would only cover rows after the cursor
+            rows = await conn.execute_fetchall(
+                f"SELECT id, document_id, page_number, pii_type, confidence, "  # noqa: S608
+                f"context_snippet, char_offset, char_length "
+                f"FROM findings WHERE {where_clause} "
+                f"AND (page_number, char_offset, id) > (?, ?, ?) "
+                f"ORDER BY page_number, char_offset, id "
+                f"LIMIT ?",
+                [*params, *after, page_size + 1],
+            )
+            count_row = await (await conn.execute(count_sql, params)).fetchone()
+            total = count_row["cnt"]
 
-        offset = (page - 1) * page_size
-        rows = conn.execute(
-            f"SELECT id, document_id, page_number, pii_type, confidence, "  # noqa: S608
-            f"context_snippet, char_offset, char_length "
-            f"FROM findings WHERE {where_clause} "
-            f"ORDER BY page_number, char_offset "
-            f"LIMIT ? OFFSET ?",
-            [*params, page_size, offset],
-        ).fetchall()
-
-    return PaginatedResponse[Finding](
-        items=[Finding(**dict(r)) for r in rows],
-        total=total,
-        page=page,
-        page_size=page_size,
-    )
+    next_cursor = _encode_cursor(rows[page_size - 1]) if len(rows) > page_size else None
+    rows = rows[:page_size]
+
+    return ORJSONResponse({
+        "items": [dict(zip(_FINDING_COLUMNS, r)) for r in rows],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+    })
@@ -0,0 +1,29 @@
+"""Liveness and readiness endpoints."""
+
+from __future__ import annotations
+
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+router = APIRouter(prefix="/api/health", tags=["health"])
+
+
+@router.get("/live")
+async def live() -> dict:
+    """The server is accepting requests."""
+    return {"status": "ok"}
+
+
+@router.get("/ready")
+async def ready(request: Request) -> JSONResponse:
+    """Whether the PII analyzer warm-up started by the lifespan has finished.
+
+    Returns 503 while it is loading or if it failed; batches still run in
+    either case, they just pay for the load themselves.
+    """
+    task = getattr(request.app.state, "warm_up", None)
+    if task is None or not task.done():
+        return JSONResponse({"status": "loading"}, status_code=503)
+    if task.cancelled() or not task.result():
+        return JSONResponse({"status": "error"}, status_code=503)
+    return JSONResponse({"status": "ready"})
@@ -2,66 +2,112 @@
 
 from __future__ import annotations
 
-import threading
+import csv
+import io
+import logging
+import sqlite3
 import uuid
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from urllib.parse import quote
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from backend.api.schemas.models import ReportRequest, ReportResponse
 from backend.core.config import settings
 from backend.core.database import db
+from backend.reports.csv_export import CSV_FIELDNAMES, CSV_ROWS_SQL
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["reports"])
 
-# In-memory report metadata store (keyed by report ID)
-_reports: dict[str, dict] = {}
+# Rows fetched from SQLite and written to the response per CSV chunk
+_CSV_CHUNK_ROWS = 1000
+
+# Bounded pool so bursts of report requests queue instead of spawning a thread each
+_report_executor = ThreadPoolExecutor(
+    max_workers=settings.worker_count, thread_name_prefix="report"
+)
+
+
+def shutdown_report_executor() -> None:
+    """Stop accepting report jobs. Called during application shutdown."""
+    _report_executor.shutdown(wait=False, cancel_futures=True)
 
 
 def _generate_report_background(report_id: str, batch_id: str, fmt: str) -> None:
-    """Run report generation in a background thread."""
+    """Run report generation on the report executor."""
     try:
         from backend.reports.generator import generate_report
 
         path = generate_report(batch_id, fmt)
-        _reports[report_id]["status"] = "completed"
-        _reports[report_id]["filename"] = path.name
-        _reports[report_id]["filepath"] = str(path)
+        with db.transaction() as conn:
+            conn.execute(
+                "UPDATE reports SET status = 'completed', filename = ?, filepath = ? "
+                "WHERE id = ?",
+                (path.name, str(path), report_id),
+            )
     except Exception as exc:
-        _reports[report_id]["status"] = "failed"
-        _reports[report_id]["error"] = str(exc)
+        logger.exception("Report %s for batch %s failed", report_id, batch_id)
+        # Nothing above this job catches its errors, so log rather than raise
+        try:
+            with db.transaction() as conn:
+                conn.execute(
+                    "UPDATE reports SET status = 'failed', error = ? WHERE id = ?",
+                    (str(exc), report_id),
+                )
+        except Exception:
+            logger.exception("Failed to mark report %s as failed", report_id)
+
+
+async def _get_report_row(report_id: str) -> sqlite3.Row:
+    """Fetch a report's metadata row or raise 404."""
+    async with db.async_connection() as conn:
+        cursor = await conn.execute(
+            "SELECT id, batch_id, format, status, created_at, filename, filepath "
+            "FROM reports WHERE id = ?",
+            (report_id,),
+        )
+        row = await cursor.fetchone()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return row
 
 
 @router.post("/reports/generate", response_model=ReportResponse)
-def generate_report_endpoint(req: ReportRequest) -> ReportResponse:
+async def generate_report_endpoint(req: ReportRequest) -> ReportResponse:
     """Generate a PDF or CSV report for a batch."""
-    with db.get_connection() as conn:
-        batch = conn.execute(
-            "SELECT id FROM batches WHERE id = ?", (req.batch_id,)
-        ).fetchone()
+    async with db.async_connection() as conn:
+        cursor = await conn.execute("SELECT id FROM batches WHERE id = ?", (req.batch_id,))
+        batch = await cursor.fetchone()
         if batch is None:
             raise HTTPException(status_code=404, detail="Batch not found")
 
     report_id = uuid.uuid4().hex
     created_at = datetime.now(timezone.utc).isoformat()
 
-    _reports[report_id] = {
-        "id": report_id,
-        "batch_id": req.batch_id,
-        "format": req.format,
-        "status": "generating",
-        "created_at": created_at,
-        "filename": None,
-        "filepath": None,
-    }
-
-    thread = threading.Thread(
-        target=_generate_report_background,
-        args=(report_id, req.batch_id, req.format),
-        daemon=True,
-    )
-    thread.start()
+    async with db.async_transaction() as conn:
+        await conn.execute(
+            "INSERT INTO reports (id, batch_id, format, status, created_at) "
+            "VALUES (?, ?, ?, 'generating', ?)",
+            (report_id, req.batch_id, req.format, created_at),
+        )
+
+    try:
+        _report_executor.submit(
+            _generate_report_background, report_id, req.batch_id, req.format
+        )
+    except RuntimeError:
+        # The executor is shut down: the server is stopping
+        async with db.async_transaction() as conn:
+            await conn.execute(
+                "UPDATE reports SET status = 'failed', error = ? WHERE id = ?",
+                ("Server is shutting down", report_id),
+            )
+        raise HTTPException(status_code=503, detail="Server is shutting down") from None
 
     return ReportResponse(
         id=report_id,
@@ -73,43 +119,76 @@ def generate_report_endpoint(req: ReportRequest) -> ReportResponse:
 
 
 @router.get("/reports/{report_id}", response_model=ReportResponse)
-def get_report_status(report_id: str) -> ReportResponse:
+async def get_report_status(report_id: str) -> ReportResponse:
     """Check the status of a report."""
-    meta = _reports.get(report_id)
-    if meta is None:
-        raise HTTPException(status_code=404, detail="Report not found")
+    row = await _get_report_row(report_id)
     return ReportResponse(
-        id=meta["id"],
-        batch_id=meta["batch_id"],
-        format=meta["format"],
-        status=meta["status"],
-        created_at=meta["created_at"],
-        filename=meta.get("filename"),
+        id=row["id"],
+        batch_id=row["batch_id"],
+        format=row["format"],
+        status=row["status"],
+        created_at=row["created_at"],
+        filename=row["filename"],
     )
 
 
 @router.get("/reports/{report_id}/download")
-def download_report(report_id: str) -> FileResponse:
+async def download_report(report_id: str) -> FileResponse:
     """Download a generated report file."""
-    meta = _reports.get(report_id)
-    if meta is None:
-        raise HTTPException(status_code=404, detail="Report not found")
+    row = await _get_report_row(report_id)
 
-    if meta["status"] != "completed":
+    if row["status"] != "completed":
         raise HTTPException(
             status_code=409,
-            detail=f"Report is not ready (status: {meta['status']})",
+            detail=f"Report is not ready (status: {row['status']})",
         )
 
-    filepath = meta.get("filepath")
+    filepath = row["filepath"]
     if filepath is None:
         raise HTTPException(status_code=500, detail="Report file path missing")
 
     content_type = (
-        "application/pdf" if meta["format"] == "pdf" else "text/csv"
+        "application/pdf" if row["format"] == "pdf" else "text/csv"
     )
     return FileResponse(
         path=filepath,
-        filename=meta["filename"],
+        filename=row["filename"],
         media_type=content_type,
     )
+
+
+async def _stream_findings_csv(batch_id: str) -> AsyncIterator[str]:
+    """Yield the findings CSV for a batch in chunks of _CSV_CHUNK_ROWS rows.
+
+    Uses the CSV report's query, so the download matches a generated report.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDNAMES)
+    async with db.async_connection() as conn, conn.execute(
+        CSV_ROWS_SQL, (batch_id,)
+    ) as cursor:
+        while rows := await cursor.fetchmany(_CSV_CHUNK_ROWS):
+            writer.writerows(rows)
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+@router.get("/batches/{batch_id}/findings.csv")
+async def export_findings_csv(batch_id: str) -> StreamingResponse:
+    """Stream a batch's findings as CSV without writing a report file."""
+    async with db.async_connection() as conn:
+        cursor = await conn.execute("SELECT name FROM batches WHERE id = ?", (batch_id,))
+        batch = await cursor.fetchone()
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found")
+
+    filename = f"RedactQC_{batch['name'].replace(' ', '_')}_{batch_id[:8]}.csv"
+    return StreamingResponse(
+        _stream_findings_csv(batch_id),
+        media_type="text/csv",
+        headers={"Content-Disposition": f"attachment; filename*=utf-8''{quote(filename)}"},
+    )
@@ -28,7 +28,7 @@ class ReportRequest(BaseModel):
 
 
 class Finding(BaseModel):
-    id: str
+    id: int
     document_id: str
     page_number: int
     pii_type: str
@@ -110,3 +110,4 @@ class PaginatedResponse(BaseModel, Generic[T]):
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None  # Keyset cursor for the next page, where supported
@@ -0,0 +1,56 @@
+"""Short-lived in-process cache for dashboard aggregate payloads."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from typing import NamedTuple
+
+
+class CachedPayload(NamedTuple):
+    """Serialized JSON body and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after ``ttl`` seconds.
+
+    Writers call :meth:`invalidate` after committing changes that affect the
+    cached aggregates. A generation counter keeps a query that started before
+    an invalidation from re-populating the cache with stale data.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, CachedPayload]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: str) -> CachedPayload | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: str, body: bytes, generation: int) -> CachedPayload:
+        """Store a serialized body, unless the cache was invalidated since ``generation``."""
+        payload = CachedPayload(body, f'"{hashlib.sha256(body).hexdigest()}"')
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, payload)
+        return payload
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+stats_cache = TTLCache(ttl=3.0)
@@ -26,6 +26,9 @@ class Settings:
     # Server
     host: str = "127.0.0.1"
     port: int = 8000
+    api_workers: int = 1  # Uvicorn worker processes (>1 needs the app import string)
+    limit_concurrency: int = 1000
+    timeout_keep_alive: int = 30  # Seconds
 
     # Processing
     worker_count: int = field(default_factory=lambda: max(1, (os.cpu_count() or 2) - 1))
@@ -41,6 +44,10 @@ class Settings:
     tesseract_cmd: str | None = None  # Auto-detect if None
     ocr_dpi: int = 300
     min_text_length: int = 50  # Pages with fewer chars trigger OCR
+    # A page is blank when, at 72 DPI, fewer than blank_page_dark_pixels
+    # pixels are darker than blank_page_dark_level (0-255 gray)
+    blank_page_dark_level: int = 200
+    blank_page_dark_pixels: int = 4
 
     # Reports
     reports_dir: Path | None = None  # Defaults to data_dir / "reports"
@@ -49,6 +56,11 @@ class Settings:
     def db_path(self) -> Path:
         return self.data_dir / "redactqc.db"
 
+    @property
+    def event_loop(self) -> str:
+        """Uvicorn event loop: uvloop where it is available (not on Windows)."""
+        return "asyncio" if os.name == "nt" else "uvloop"
+
     @property
     def resolved_reports_dir(self) -> Path:
         return self.reports_dir or (self.data_dir / "reports")
@@ -2,15 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import sqlite3
 import threading
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 from pathlib import Path
-from typing import Generator
+
+import aiosqlite
 
 from backend.core.config import settings
 
-SCHEMA_VERSION = 1
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 3
+
+# Per-connection settings. WAL lets dashboard reads proceed while batch
+# processing writes; NORMAL sync is durable in WAL mode except on power loss.
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    # Sample at most ~1000 rows per index in ANALYZE / PRAGMA optimize
+    "PRAGMA analysis_limit=1000",
+)
+
+# Long-lived connections see a small, fixed set of SQL strings; keep them all
+# prepared instead of re-parsing once the default cache of 128 overflows.
+CACHED_STATEMENTS = 512
+
+# Read connections kept for sync callers (batch processing, report generation)
+READER_POOL_SIZE = 4
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -47,7 +74,7 @@ CREATE TABLE IF NOT EXISTS documents (
 );
 
 CREATE TABLE IF NOT EXISTS findings (
-    id TEXT PRIMARY KEY,
+    id INTEGER PRIMARY KEY,
     document_id TEXT NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
     page_number INTEGER NOT NULL,
     pii_type TEXT NOT NULL,
@@ -57,11 +84,35 @@ CREATE TABLE IF NOT EXISTS findings (
     char_length INTEGER NOT NULL DEFAULT 0
 );
 
-CREATE INDEX IF NOT EXISTS idx_documents_batch_id ON documents(batch_id);
-CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status);
-CREATE INDEX IF NOT EXISTS idx_findings_document_id ON findings(document_id);
+CREATE TABLE IF NOT EXISTS reports (
+    id TEXT PRIMARY KEY,
+    batch_id TEXT NOT NULL REFERENCES batches(id) ON DELETE CASCADE,
+    format TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'generating',
+    created_at TEXT NOT NULL DEFAULT (datetime('now')),
+    filename TEXT,
+    filepath TEXT,
+    error TEXT
+);
+
+-- (batch_id, <sort column>) lets batch listings walk the index in order
+-- instead of sorting; batch_filename also covers plain batch_id lookups.
+DROP INDEX IF EXISTS idx_documents_batch_id;
+CREATE INDEX IF NOT EXISTS idx_docs_batch_filename ON documents(batch_id, filename);
+CREATE INDEX IF NOT EXISTS idx_docs_batch_findings ON documents(batch_id, finding_count);
+DROP INDEX IF EXISTS idx_docs_batch_status;
+DROP INDEX IF EXISTS idx_documents_status;
+CREATE INDEX IF NOT EXISTS idx_docs_batch_status_filename
+    ON documents(batch_id, status, filename);
+CREATE INDEX IF NOT EXISTS idx_docs_batch_processed ON documents(batch_id, processed_at);
+DROP INDEX IF EXISTS idx_findings_document_id;
+CREATE INDEX IF NOT EXISTS idx_findings_doc_type_conf
+    ON findings(document_id, pii_type, confidence);
+CREATE INDEX IF NOT EXISTS idx_findings_doc_position
+    ON findings(document_id, page_number, char_offset, id);
 CREATE INDEX IF NOT EXISTS idx_findings_pii_type ON findings(pii_type);
-CREATE INDEX IF NOT EXISTS idx_findings_confidence ON findings(confidence);
+-- Confidence is only ever filtered within a document (doc_type_conf covers it)
+DROP INDEX IF EXISTS idx_findings_confidence;
 """
 
 DEFAULT_PII_CATEGORIES = [
@@ -88,45 +139,194 @@ DEFAULT_PII_CATEGORIES = [
 ]
 
 
+def _stage_findings_migration(conn: sqlite3.Connection) -> None:
+    """Move a schema-2 findings table (TEXT UUID ids) aside for rebuilding.
+
+    Its indexes are dropped so SCHEMA_SQL recreates them, under the same
+    names, on the new INTEGER PRIMARY KEY table.
+    """
+    id_types = [
+        row["type"] for row in conn.execute("PRAGMA table_info(findings)") if row["name"] == "id"
+    ]
+    if not id_types or id_types[0].upper() == "INTEGER":
+        return
+    logger.info("Migrating findings to integer ids")
+    index_names = conn.execute(
+        "SELECT name FROM sqlite_master "
+        "WHERE type = 'index' AND tbl_name = 'findings' AND sql IS NOT NULL"
+    ).fetchall()
+    for row in index_names:
+        conn.execute(f'DROP INDEX "{row["name"]}"')
+    conn.execute("ALTER TABLE findings RENAME TO findings_v2")
+
+
+def _finish_findings_migration(conn: sqlite3.Connection) -> None:
+    """Copy staged schema-2 findings into the new table, keeping their order."""
+    staged = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'findings_v2'"
+    ).fetchone()
+    if staged is None:
+        return
+    conn.execute(
+        "INSERT INTO findings (document_id, page_number, pii_type, confidence, "
+        "context_snippet, char_offset, char_length) "
+        "SELECT document_id, page_number, pii_type, confidence, "
+        "context_snippet, char_offset, char_length FROM findings_v2 ORDER BY rowid"
+    )
+    conn.execute("DROP TABLE findings_v2")
+
+
 class Database:
-    """Thread-safe SQLite database manager."""
+    """Thread-safe SQLite database manager.
+
+    Writes go through one writer connection held behind a lock; reads borrow
+    from a small pool of query_only connections, which WAL lets run alongside
+    the writer.
+    """
 
     def __init__(self, db_path: Path | None = None):
         self._db_path = db_path or settings.db_path
-        self._local = threading.local()
-
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = getattr(self._local, "connection", None)
-        if conn is None:
-            self._db_path.parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(str(self._db_path), timeout=30)
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            conn.execute("PRAGMA busy_timeout=5000")
-            self._local.connection = conn
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._writer: sqlite3.Connection | None = None
+        self._write_lock = threading.Lock()
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._reader_slots = threading.BoundedSemaphore(READER_POOL_SIZE)
+        self._pool_lock = threading.Lock()
+        # Async connections for the API's event loop: one shared reader and one
+        # writer serialized behind a lock (a transaction must own its connection).
+        self._async_reader: aiosqlite.Connection | None = None
+        self._async_writer: aiosqlite.Connection | None = None
+        self._async_open_lock = asyncio.Lock()
+        self._async_write_lock = asyncio.Lock()
+
+    def _open(self, read_only: bool = False) -> sqlite3.Connection:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transaction() issues BEGIN IMMEDIATE itself. Access
+        # is serialized by the locks below, so connections may change threads.
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
         return conn
 
     @contextmanager
-    def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a thread-local database connection."""
-        yield self._get_connection()
+    def get_writer(self) -> Generator[sqlite3.Connection, None, None]:
+        """Hold the single writer connection for the duration of the block."""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open()
+            yield self._writer
+
+    @contextmanager
+    def get_reader(self) -> Generator[sqlite3.Connection, None, None]:
+        """Borrow a read-only connection from the pool.
+
+        At most READER_POOL_SIZE readers are open; further callers wait for
+        one to be returned.
+        """
+        with self._reader_slots:
+            with self._pool_lock:
+                conn = self._idle_readers.pop() if self._idle_readers else None
+            if conn is None:
+                conn = self._open(read_only=True)
+            try:
+                yield conn
+            finally:
+                with self._pool_lock:
+                    self._idle_readers.append(conn)
 
     @contextmanager
     def transaction(self) -> Generator[sqlite3.Connection, None, None]:
-        """Execute within a transaction (auto-commit/rollback)."""
-        conn = self._get_connection()
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+        """Execute within a transaction (auto-commit/rollback).
+
+        BEGIN IMMEDIATE takes the write lock up front, so concurrent writers
+        wait on busy_timeout instead of failing when a read upgrades to a write.
+        """
+        with self.get_writer() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+    async def _open_async(self, read_only: bool = False) -> aiosqlite.Connection:
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = await aiosqlite.connect(
+            str(self._db_path),
+            timeout=30,
+            isolation_level=None,
+            cached_statements=CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            await conn.execute(pragma)
+        if read_only:
+            await conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @asynccontextmanager
+    async def async_connection(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Get the shared async connection for read-only queries.
+
+        The connection lives for the whole process and is opened with
+        query_only, so an accidental write raises instead of slipping past the
+        writer lock.
+        """
+        if self._async_reader is None:
+            async with self._async_open_lock:
+                if self._async_reader is None:
+                    self._async_reader = await self._open_async(read_only=True)
+        yield self._async_reader
+
+    @asynccontextmanager
+    async def async_transaction(self) -> AsyncGenerator[aiosqlite.Connection, None]:
+        """Async variant of transaction() on the dedicated writer connection."""
+        async with self._async_write_lock:
+            if self._async_writer is None:
+                self._async_writer = await self._open_async()
+            conn = self._async_writer
+            await conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+                await conn.execute("COMMIT")
+            except Exception:
+                await conn.execute("ROLLBACK")
+                raise
 
     def initialize(self) -> None:
-        """Create schema and seed data."""
+        """Create schema and seed data. Later calls in the same process are no-ops."""
+        if self._initialized:
+            return
+        with self._init_lock:
+            if not self._initialized:
+                self._initialize()
+                self._initialized = True
+
+    def _initialize(self) -> None:
+        with self.get_writer() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+            if mode != "wal":
+                logger.warning(
+                    "SQLite WAL mode unavailable for %s (journal_mode=%s)", self._db_path, mode
+                )
         with self.transaction() as conn:
+            _stage_findings_migration(conn)
+        with self.get_writer() as conn:
+            # executescript() commits any open transaction, so run the DDL first.
             conn.executescript(SCHEMA_SQL)
+        with self.transaction() as conn:
+            _finish_findings_migration(conn)
             # Check if already seeded
             row = conn.execute(
                 "SELECT COUNT(*) as cnt FROM pii_categories"
@@ -137,17 +337,57 @@ class Database:
                     "VALUES (?, ?, ?, ?)",
                     DEFAULT_PII_CATEGORIES,
                 )
-                conn.execute(
-                    "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
-                    (SCHEMA_VERSION,),
-                )
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_version (version) VALUES (?)",
+                (SCHEMA_VERSION,),
+            )
+
+    def fail_interrupted_reports(self) -> int:
+        """Mark reports left 'generating' by a previous server run as failed.
+
+        Report jobs run on the executor of the API worker that queued them,
+        so this is only safe before any worker is serving: the launcher
+        calls it once per server start. A worker's own startup must not, as
+        sibling workers may be generating reports. Returns the rows changed.
+        """
+        self.initialize()
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE reports SET status = 'failed', error = ? WHERE status = 'generating'",
+                ("Interrupted: the application exited before the report finished",),
+            )
+            return cursor.rowcount
+
+    def optimize(self) -> None:
+        """Let SQLite refresh planner statistics that have gone stale.
+
+        Cheap when nothing changed; analysis_limit bounds the work otherwise.
+        """
+        with self.get_writer() as conn:
+            conn.execute("PRAGMA optimize")
 
     def close(self) -> None:
-        """Close the thread-local connection if open."""
-        conn = getattr(self._local, "connection", None)
-        if conn is not None:
-            conn.close()
-            self._local.connection = None
+        """Close the writer and any idle reader connections."""
+        with self._write_lock:
+            if self._writer is not None:
+                try:
+                    self._writer.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._writer.close()
+                self._writer = None
+        with self._pool_lock:
+            for conn in self._idle_readers:
+                conn.close()
+            self._idle_readers.clear()
+
+    async def aclose(self) -> None:
+        """Close the async connections if open."""
+        for conn in (self._async_reader, self._async_writer):
+            if conn is not None:
+                await conn.close()
+        self._async_reader = None
+        self._async_writer = None
 
 
 # Global singleton
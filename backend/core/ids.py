@@ -0,0 +1,20 @@
+"""Time-ordered identifiers for database primary keys."""
+
+from __future__ import annotations
+
+import os
+import time
+
+
+def uuid7_hex() -> str:
+    """Return a UUIDv7 (RFC 9562) as 32 hex characters.
+
+    The leading 48 bits are the Unix time in milliseconds, so IDs generated
+    in sequence land next to each other in the primary-key B-tree instead of
+    on random pages. The remaining 74 bits are random.
+    """
+    rand = int.from_bytes(os.urandom(10), "big")
+    rand_a = (rand >> 64) & 0xFFF
+    rand_b = (rand & ((1 << 62) - 1)) | (0b10 << 62)  # RFC variant bits
+    timestamp = (time.time_ns() // 1_000_000) & 0xFFFFFFFFFFFF
+    return f"{timestamp:012x}7{rand_a:03x}{rand_b:016x}"
@@ -8,6 +8,11 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
 
+_ZEROS = memoryview(bytes(1 << 20))  # 1 MiB overwrite buffer
+
+# Only the data blocks need to reach disk; fdatasync is missing on macOS/Windows
+_datasync = getattr(os, "fdatasync", os.fsync)
+
 
 def secure_delete(path: Path) -> None:
     """Overwrite file contents with zeros before unlinking."""
@@ -15,10 +20,13 @@ def secure_delete(path: Path) -> None:
         return
     try:
         size = path.stat().st_size
-        with open(path, "wb") as f:
-            f.write(b"\x00" * size)
-            f.flush()
-            os.fsync(f.fileno())
+        # "r+b" overwrites the existing blocks; "wb" would truncate first and
+        # let the filesystem hand out fresh ones.
+        with open(path, "r+b", buffering=0) as f:
+            remaining = size
+            while remaining:
+                remaining -= f.write(_ZEROS[: min(remaining, len(_ZEROS))])
+            _datasync(f.fileno())
         path.unlink()
     except OSError:
         # Best effort — still unlink
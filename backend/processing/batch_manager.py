@@ -3,16 +3,45 @@
 from __future__ import annotations
 
 import logging
-import uuid
+import sqlite3
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+from backend.core.cache import stats_cache
 from backend.core.config import settings
 from backend.core.database import db
+from backend.core.ids import uuid7_hex
 from backend.processing.worker_pool import WorkerPool, WorkerResult
 
 logger = logging.getLogger(__name__)
 
+# Upper bound in seconds on how long finished documents wait to be committed
+_COMMIT_INTERVAL = 1.0
+
+# Rows per executemany call when registering a folder's documents
+_INSERT_CHUNK_ROWS = 10_000
+
+# Statements for recording worker results
+_SQL_COMPLETE_DOCUMENT = (
+    "UPDATE documents SET status = 'completed', page_count = ?, "
+    "finding_count = ?, processed_at = ? WHERE id = ?"
+)
+# WorkerResult.findings_data rows are built in this column order
+_SQL_INSERT_FINDING = (
+    "INSERT INTO findings "
+    "(document_id, page_number, pii_type, confidence, "
+    "context_snippet, char_offset, char_length) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+# Batch counters move in one statement per document
+_SQL_COUNT_PROCESSED = (
+    "UPDATE batches SET processed_docs = processed_docs + 1, "
+    "docs_with_findings = docs_with_findings + ? "
+    "WHERE id = (SELECT batch_id FROM documents WHERE id = ?)"
+)
+_SQL_FAIL_DOCUMENT = "UPDATE documents SET status = 'error', processed_at = ? WHERE id = ?"
+
 
 def create_batch(source_path: str, name: str | None = None) -> str:
     """Create a new batch by scanning a folder for PDF files.
@@ -45,9 +74,10 @@ def create_batch(source_path: str, name: str | None = None) -> str:
     if not unique_pdfs:
         raise ValueError(f"No PDF files found in: {source_path}")
 
-    batch_id = str(uuid.uuid4())
+    batch_id = uuid7_hex()
     batch_name = name or folder.name
     now = datetime.now(timezone.utc).isoformat()
+    doc_rows = [(uuid7_hex(), batch_id, f.name, str(f)) for f in unique_pdfs]
 
     with db.transaction() as conn:
         conn.execute(
@@ -55,90 +85,102 @@ def create_batch(source_path: str, name: str | None = None) -> str:
             "VALUES (?, ?, ?, ?, 'pending', ?)",
             (batch_id, batch_name, str(folder), now, len(unique_pdfs)),
         )
-
-        for pdf_file in unique_pdfs:
-            doc_id = str(uuid.uuid4())
-            conn.execute(
+        for start in range(0, len(doc_rows), _INSERT_CHUNK_ROWS):
+            conn.executemany(
                 "INSERT INTO documents (id, batch_id, filename, filepath, status) "
                 "VALUES (?, ?, ?, ?, 'pending')",
-                (doc_id, batch_id, pdf_file.name, str(pdf_file)),
+                doc_rows[start:start + _INSERT_CHUNK_ROWS],
             )
 
+    stats_cache.invalidate()
     logger.info("Created batch %s with %d documents from %s", batch_id, len(unique_pdfs), folder)
     return batch_id
 
 
 def _get_pending_documents(batch_id: str) -> list[tuple[str, str]]:
     """Get documents in a batch that haven't been processed yet."""
-    with db.get_connection() as conn:
+    # "+filename" keeps the planner from walking every document of the batch in
+    # (batch_id, filename) order; the few unfinished rows are seeked through
+    # (batch_id, status, filename) and sorted in memory instead.
+    with db.get_reader() as conn:
         rows = conn.execute(
             "SELECT id, filepath FROM documents "
             "WHERE batch_id = ? AND status IN ('pending', 'error') "
-            "ORDER BY filename",
+            "ORDER BY +filename",
             (batch_id,),
         ).fetchall()
     return [(row["id"], row["filepath"]) for row in rows]
 
 
-def _record_result(result: WorkerResult) -> None:
-    """Save a single document's processing result to the database."""
+def _write_results(results: list[WorkerResult], conn: sqlite3.Connection) -> None:
+    """Save documents' results within the caller's transaction.
+
+    Rows for every result are gathered first so each statement runs as a
+    single executemany; the fixed SQL constants keep one prepared statement
+    per query in the connection's statement cache.
+    """
     now = datetime.now(timezone.utc).isoformat()
+    completed: list[tuple] = []
+    finding_rows: list[tuple] = []
+    processed: list[tuple] = []
+    failed: list[tuple] = []
 
-    with db.transaction() as conn:
+    for result in results:
         if result.success:
-            # Update document status
-            conn.execute(
-                "UPDATE documents SET status = 'completed', page_count = ?, "
-                "finding_count = ?, processed_at = ? WHERE id = ?",
-                (result.page_count, len(result.findings_data), now, result.doc_id),
+            completed.append(
+                (result.page_count, len(result.findings_data), now, result.doc_id)
             )
-
-            # Insert findings
-            for finding in result.findings_data:
-                finding_id = str(uuid.uuid4())
-                conn.execute(
-                    "INSERT INTO findings "
-                    "(id, document_id, page_number, pii_type, confidence, "
-                    "context_snippet, char_offset, char_length) "
-                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                    (
-                        finding_id,
-                        result.doc_id,
-                        finding["page_num"],
-                        finding["pii_type"],
-                        finding["confidence"],
-                        finding["context_snippet"],
-                        finding["start"],
-                        finding["end"] - finding["start"],
-                    ),
-                )
-
-            # Update batch counters
-            doc_row = conn.execute(
-                "SELECT batch_id FROM documents WHERE id = ?",
-                (result.doc_id,),
-            ).fetchone()
-            if doc_row:
-                batch_id = doc_row["batch_id"]
-                conn.execute(
-                    "UPDATE batches SET processed_docs = processed_docs + 1 WHERE id = ?",
-                    (batch_id,),
-                )
-                if len(result.findings_data) > 0:
-                    conn.execute(
-                        "UPDATE batches SET docs_with_findings = docs_with_findings + 1 "
-                        "WHERE id = ?",
-                        (batch_id,),
-                    )
+            finding_rows.extend(result.findings_data)
+            processed.append((1 if result.findings_data else 0, result.doc_id))
         else:
-            conn.execute(
-                "UPDATE documents SET status = 'error', processed_at = ? WHERE id = ?",
-                (now, result.doc_id),
-            )
+            failed.append((now, result.doc_id))
             logger.error(
                 "Document %s failed: %s", result.doc_id, result.error
             )
 
+    if completed:
+        conn.executemany(_SQL_COMPLETE_DOCUMENT, completed)
+    if finding_rows:
+        conn.executemany(_SQL_INSERT_FINDING, finding_rows)
+    if processed:
+        conn.executemany(_SQL_COUNT_PROCESSED, processed)
+    if failed:
+        conn.executemany(_SQL_FAIL_DOCUMENT, failed)
+
+
+def _record_results(results: list[WorkerResult]) -> None:
+    """Save several documents' results in one transaction (one WAL commit)."""
+    if not results:
+        return
+    with db.transaction() as conn:
+        _write_results(results, conn)
+    stats_cache.invalidate()
+
+
+class _ResultRecorder:
+    """Buffers worker results and commits them in groups.
+
+    While a chunk runs, buffered results are committed once _COMMIT_INTERVAL
+    seconds have passed since the last flush; the rest when the chunk ends. The write lock is only
+    held for the short flush, and batch progress stays current for the UI.
+    Documents whose results were never flushed stay pending, so resuming a
+    batch reprocesses them.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[WorkerResult] = []
+        self._last_flush = time.monotonic()
+
+    def __call__(self, result: WorkerResult) -> None:
+        self._pending.append(result)
+        if time.monotonic() - self._last_flush >= _COMMIT_INTERVAL:
+            self.flush()
+
+    def flush(self) -> None:
+        _record_results(self._pending)
+        self._pending = []
+        self._last_flush = time.monotonic()
+
 
 def start_batch(
     batch_id: str,
@@ -157,13 +199,14 @@ def start_batch(
     Returns:
         Summary dict with processed/failed/skipped counts.
     """
-    with db.transaction() as conn:
+    with db.get_reader() as conn:
         batch = conn.execute(
             "SELECT * FROM batches WHERE id = ?", (batch_id,)
         ).fetchone()
-        if not batch:
-            raise ValueError(f"Batch not found: {batch_id}")
+    if not batch:
+        raise ValueError(f"Batch not found: {batch_id}")
 
+    with db.transaction() as conn:
         conn.execute(
             "UPDATE batches SET status = 'processing' WHERE id = ?",
             (batch_id,),
@@ -194,10 +237,14 @@ def start_batch(
     for i in range(0, len(pending_docs), chunk_size):
         chunk = pending_docs[i : i + chunk_size]
 
-        if sequential:
-            results = pool.process_batch_sequential(chunk, on_result=_record_result)
-        else:
-            results = pool.process_batch(chunk, on_result=_record_result)
+        recorder = _ResultRecorder()
+        try:
+            if sequential:
+                results = pool.process_batch_sequential(chunk, on_result=recorder)
+            else:
+                results = pool.process_batch(chunk, on_result=recorder)
+        finally:
+            recorder.flush()
 
         for result in results:
             if result.success:
@@ -211,6 +258,8 @@ def start_batch(
             "UPDATE batches SET status = 'completed' WHERE id = ?",
             (batch_id,),
         )
+    # A batch adds many rows at once; refresh planner stats for later queries
+    db.optimize()
 
     skipped = batch["total_docs"] - len(pending_docs)
     summary = {
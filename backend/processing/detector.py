@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import re
 import sys
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
+import re2
 import spacy
-from presidio_analyzer import AnalyzerEngine, RecognizerRegistry
-from presidio_analyzer.nlp_engine import SpacyNlpEngine
+from presidio_analyzer import AnalyzerEngine, PatternRecognizer, RecognizerRegistry
+from presidio_analyzer.nlp_engine import NlpArtifacts, SpacyNlpEngine
 
 from backend.core.config import settings
 from backend.processing.recognizers.legal_pii import (
@@ -26,6 +33,7 @@ from backend.processing.recognizers.financial_pii import (
     RoutingNumberRecognizer,
 )
 from backend.processing.recognizers.medical_pii import MedicalRecordRecognizer
+from backend.processing.recognizers.patterns import PRESIDIO_FLAGS, precompile
 from backend.processing.recognizers.digital_pii import (
     DeviceIDRecognizer,
     MACAddressRecognizer,
@@ -34,9 +42,12 @@ from backend.processing.recognizers.digital_pii import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
-    """A single PII detection finding."""
+    """A single PII detection finding.
+
+    Slotted: a long document can hold many thousands of these at once.
+    """
 
     pii_type: str
     confidence: float
@@ -82,8 +93,14 @@ def _patch_spacy_for_frozen():
     spacy.util.is_same_func = _safe_is_same_func
 
 
+# Presidio reads entities, tokens and lemmas from spaCy, never the dependency
+# parse. The lemmatizer needs tagger and attribute_ruler, so only the parser,
+# one of the costliest components, can go; excluding it also skips loading it.
+_SPACY_EXCLUDE = ["parser"]
+
+
 def _load_spacy_model():
-    """Load the spaCy NER model.
+    """Load the spaCy NER model without its dependency parser.
 
     In frozen (PyInstaller) mode, loads by path from the bundled data
     directory.  This avoids Presidio's fallback which tries to run
@@ -100,11 +117,11 @@ def _load_spacy_model():
             for subdir in sorted(model_base.iterdir(), reverse=True):
                 if subdir.is_dir() and subdir.name.startswith("en_core_web_lg"):
                     logger.info("Loading spaCy model from bundle: %s", subdir)
-                    return spacy.load(str(subdir))
+                    return spacy.load(str(subdir), exclude=_SPACY_EXCLUDE)
         raise RuntimeError(
             "Bundled spaCy model 'en_core_web_lg' not found in frozen app"
         )
-    return spacy.load("en_core_web_lg")
+    return spacy.load("en_core_web_lg", exclude=_SPACY_EXCLUDE)
 
 
 def build_analyzer() -> AnalyzerEngine:
@@ -124,6 +141,12 @@ def build_analyzer() -> AnalyzerEngine:
 
     registry = RecognizerRegistry()
     registry.load_predefined_recognizers()
+    for recognizer in registry.recognizers:
+        if (
+            isinstance(recognizer, PatternRecognizer)
+            and recognizer.global_regex_flags == PRESIDIO_FLAGS
+        ):
+            precompile(recognizer.patterns)
 
     for recognizer_cls in CUSTOM_RECOGNIZERS:
         registry.add_recognizer(recognizer_cls())
@@ -132,6 +155,111 @@ def build_analyzer() -> AnalyzerEngine:
     return analyzer
 
 
+_analyzer: AnalyzerEngine | None = None
+_analyzer_lock = threading.Lock()
+
+
+def get_analyzer() -> AnalyzerEngine:
+    """Return the process-wide AnalyzerEngine, building it on first use.
+
+    Loading en_core_web_lg takes seconds, so callers that do not manage their
+    own analyzer share this one instead of rebuilding it per document.
+    """
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                _analyzer = build_analyzer()
+    return _analyzer
+
+
+# Entity types whose every recognizer (Presidio built-ins and ours) needs at
+# least one digit to match. On a page without digits they cannot fire, so
+# analyze() is asked only for the rest; spaCy entities are always kept.
+_DIGIT_ANCHORED_ENTITIES = frozenset({
+    "CASE_NUMBER",
+    "CREDIT_CARD",
+    "CRYPTO",
+    "IBAN_CODE",
+    "MEDICAL_LICENSE",
+    "MEDICAL_RECORD",
+    "PHONE_NUMBER",
+    "ROUTING_NUMBER",
+    "UK_NHS",
+    "US_BANK_NUMBER",
+    "US_DRIVER_LICENSE",
+    "US_ITIN",
+    "US_PASSPORT",
+    "US_SSN",
+})
+_HAS_DIGIT = re.compile(r"\d")
+
+# Of those, the entity types whose every recognizer needs at least eight
+# consecutive digits (bank account numbers, 9-digit passports, A+8 digit
+# passports, routing numbers). Pages with only short digit runs skip them too.
+_LONG_DIGIT_RUN_ENTITIES = frozenset({
+    "ROUTING_NUMBER",
+    "US_BANK_NUMBER",
+    "US_PASSPORT",
+})
+# RE2's \p{Nd} is the Unicode digit class Python's \d matches; the re module
+# retries \d{8} from every digit and costs several times more per page.
+_HAS_LONG_DIGIT_RUN = re2.compile(r"\p{Nd}{8}")
+
+_screened_entities: weakref.WeakKeyDictionary[
+    AnalyzerEngine, dict[tuple[str, frozenset[str]], list[str] | None]
+] = weakref.WeakKeyDictionary()
+
+
+def _entities_without(
+    analyzer: AnalyzerEngine, language: str, dropped: frozenset[str]
+) -> list[str] | None:
+    """Entities worth requesting once *dropped* are ruled out, or None to request all."""
+    per_screen = _screened_entities.setdefault(analyzer, {})
+    key = (language, dropped)
+    if key not in per_screen:
+        supported = analyzer.get_supported_entities(language)
+        kept = [e for e in supported if e not in dropped]
+        # None when nothing is dropped: analyze() then defaults to all entities
+        per_screen[key] = kept if len(kept) < len(supported) else None
+    return per_screen[key]
+
+
+# Repeated page text (cover sheets, certificates, boilerplate) is analyzed once.
+# Raw spans are kept per analyzer, keyed on a digest of (language, text), and the
+# confidence threshold is applied when they are projected into Findings.
+_ANALYSIS_CACHE_SIZE = 1024
+
+_Spans = tuple[tuple[str, float, int, int], ...]
+_analysis_cache: weakref.WeakKeyDictionary[AnalyzerEngine, OrderedDict[bytes, _Spans]] = (
+    weakref.WeakKeyDictionary()
+)
+_analysis_cache_lock = threading.Lock()
+
+
+def _text_key(text: str, language: str) -> bytes:
+    digest = hashlib.blake2b(language.encode(), digest_size=16)
+    digest.update(text.encode("utf-8", "surrogatepass"))
+    return digest.digest()
+
+
+def _cached_spans(analyzer: AnalyzerEngine, key: bytes) -> _Spans | None:
+    with _analysis_cache_lock:
+        entries = _analysis_cache.get(analyzer)
+        if entries is None or key not in entries:
+            return None
+        entries.move_to_end(key)
+        return entries[key]
+
+
+def _store_spans(analyzer: AnalyzerEngine, key: bytes, spans: _Spans) -> None:
+    with _analysis_cache_lock:
+        entries = _analysis_cache.setdefault(analyzer, OrderedDict())
+        entries[key] = spans
+        if len(entries) > _ANALYSIS_CACHE_SIZE:
+            entries.popitem(last=False)
+
+
 def extract_context(text: str, start: int, end: int, window: int | None = None) -> str:
     """Extract a context snippet around a finding.
 
@@ -142,7 +270,8 @@ def extract_context(text: str, start: int, end: int, window: int | None = None)
     ctx_start = max(0, start - window)
     ctx_end = min(len(text), end + window)
     snippet = text[ctx_start:ctx_end]
-    # Replace newlines with spaces for cleaner display
+    # Collapse newlines/whitespace runs for cleaner display. split()/join runs
+    # in C and beats both str.translate + re.sub and a single \s+ regex here.
     return " ".join(snippet.split())
 
 
@@ -152,6 +281,7 @@ def detect_pii(
     analyzer: AnalyzerEngine,
     language: str | None = None,
     threshold: float | None = None,
+    nlp_artifacts: NlpArtifacts | None = None,
 ) -> list[Finding]:
     """Run PII detection on text and return findings above the confidence threshold.
 
@@ -161,6 +291,7 @@ def detect_pii(
         analyzer: Presidio AnalyzerEngine instance.
         language: Language code (defaults to settings.default_language).
         threshold: Minimum confidence threshold (defaults to settings.confidence_threshold).
+        nlp_artifacts: Pre-computed spaCy output for ``text``; skips the NLP pass.
 
     Returns:
         List of Finding objects for detected PII.
@@ -171,26 +302,116 @@ def detect_pii(
     language = language or settings.default_language
     threshold = threshold if threshold is not None else settings.confidence_threshold
 
-    try:
-        results = analyzer.analyze(text=text, language=language)
-    except Exception:
-        logger.exception("PII detection failed for page %d", page_num)
-        return []
-
+    key = _text_key(text, language)
+    spans = _cached_spans(analyzer, key)
+    if spans is None:
+        entities = None
+        if _HAS_DIGIT.search(text) is None:
+            entities = _entities_without(analyzer, language, _DIGIT_ANCHORED_ENTITIES)
+        elif _HAS_LONG_DIGIT_RUN.search(text) is None:
+            entities = _entities_without(analyzer, language, _LONG_DIGIT_RUN_ENTITIES)
+        if entities == []:
+            spans = ()
+        else:
+            try:
+                results = analyzer.analyze(
+                    text=text, language=language, entities=entities, nlp_artifacts=nlp_artifacts
+                )
+            except Exception:
+                logger.exception("PII detection failed for page %d", page_num)
+                return []
+            spans = tuple((r.entity_type, r.score, r.start, r.end) for r in results)
+        _store_spans(analyzer, key, spans)
+
+    # Read the setting once rather than per finding
+    window = settings.context_chars
     findings: list[Finding] = []
-    for result in results:
-        if result.score < threshold:
+    for pii_type, score, start, end in spans:
+        if score < threshold:
             continue
 
-        context = extract_context(text, result.start, result.end)
+        context = extract_context(text, start, end, window)
 
         findings.append(Finding(
-            pii_type=result.entity_type,
-            confidence=result.score,
-            start=result.start,
-            end=result.end,
+            pii_type=pii_type,
+            confidence=score,
+            start=start,
+            end=end,
             page_num=page_num,
             context_snippet=context,
         ))
 
     return findings
+
+
+def detect_pii_batch(
+    pages: list[tuple[int, str]],
+    analyzer: AnalyzerEngine,
+    language: str | None = None,
+    threshold: float | None = None,
+    batch_size: int = 16,
+    on_page_findings: Callable[[list[Finding]], None] | None = None,
+) -> list[Finding]:
+    """Run PII detection over several pages, batching the spaCy pass.
+
+    Page texts go through ``nlp.pipe`` together (via the NLP engine's
+    ``process_batch``), and each page's pre-computed artifacts are handed to
+    ``detect_pii``. Pages whose text was already analyzed (earlier in the
+    document or in a recent one) skip the NLP pass. If the batched NLP pass
+    fails, the remaining pages are analyzed one at a time.
+
+    Args:
+        pages: (page_num, text) pairs; blank pages are skipped.
+        analyzer: Presidio AnalyzerEngine instance.
+        language: Language code (defaults to settings.default_language).
+        threshold: Minimum confidence threshold (defaults to settings.confidence_threshold).
+        batch_size: Number of pages spaCy processes per batch.
+        on_page_findings: Called with each analyzed page's findings as soon as
+            they are ready. When given, findings are not accumulated.
+
+    Returns:
+        List of Finding objects for all pages, in page order (empty when
+        ``on_page_findings`` is given).
+    """
+    pages = [(page_num, text) for page_num, text in pages if text and text.strip()]
+    if not pages:
+        return []
+
+    language = language or settings.default_language
+
+    # Only the first occurrence of each uncached text needs spaCy; repeats are
+    # served from the analysis cache once that occurrence has been analyzed.
+    needs_nlp: list[bool] = []
+    queued: set[bytes] = set()
+    for _, text in pages:
+        key = _text_key(text, language)
+        fresh = key not in queued and _cached_spans(analyzer, key) is None
+        if fresh:
+            queued.add(key)
+        needs_nlp.append(fresh)
+
+    nlp_texts = [text for (_, text), fresh in zip(pages, needs_nlp) if fresh]
+    batch: Iterator[tuple[str, NlpArtifacts]] | None = None
+    if nlp_texts:
+        try:
+            batch = iter(analyzer.nlp_engine.process_batch(
+                nlp_texts, language, batch_size=batch_size
+            ))
+        except Exception:
+            logger.exception("Batched NLP failed; analyzing pages individually")
+
+    findings: list[Finding] = []
+    emit = on_page_findings or findings.extend
+    for (page_num, text), fresh in zip(pages, needs_nlp):
+        nlp_artifacts = None
+        if fresh and batch is not None:
+            try:
+                nlp_artifacts = next(batch)[1]
+            except Exception:
+                logger.exception("Batched NLP failed; analyzing remaining pages individually")
+                batch = None
+        emit(detect_pii(
+            text, page_num, analyzer, language, threshold, nlp_artifacts=nlp_artifacts
+        ))
+
+    return findings
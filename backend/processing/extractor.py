@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import logging
+import os
 import platform
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -49,14 +53,41 @@ def extract_page_pymupdf(page: fitz.Page) -> str:
     return page.get_text("text") or ""
 
 
-def extract_page_ocr(page: fitz.Page, dpi: int | None = None) -> tuple[str, float]:
+def extract_page_ocr(
+    page: fitz.Page,
+    dpi: int | None = None,
+    render_lock: threading.Lock | None = None,
+    skip_blank: bool = True,
+) -> tuple[str, float]:
     """Run Tesseract OCR on a page rendered as an image.
 
+    PyMuPDF documents are not thread-safe, so when pages of one document are
+    OCR'd concurrently the caller passes the document's ``render_lock``; it is
+    held only while rendering, not while Tesseract runs.
+
+    With ``skip_blank``, pages with next to no dark pixels at 72 DPI
+    (separator sheets, trailing whitespace pages) are returned as empty text with confidence
+    0.0, without rendering at full DPI or invoking Tesseract. Small or light
+    text can look blank at that resolution, so callers pass
+    ``skip_blank=False`` for pages that have a text layer.
+
     Returns (text, confidence) tuple.
     """
+    import numpy as np
     import pytesseract
     from PIL import Image
-    import io
+
+    # Cheap first pass: a low-res render with no ink has nothing to OCR
+    if skip_blank:
+        with render_lock or nullcontext():
+            preview = page.get_pixmap(colorspace=fitz.csGRAY, alpha=False)
+        # Count ink, not contrast: one short line of small print barely moves
+        # the page's stddev, but still leaves dark pixels behind
+        samples = np.frombuffer(preview.samples, dtype=np.uint8)
+        dark = np.count_nonzero(samples < settings.blank_page_dark_level)
+        if dark < settings.blank_page_dark_pixels:
+            return "", 0.0
+        del preview
 
     if settings.tesseract_cmd:
         pytesseract.pytesseract.tesseract_cmd = settings.tesseract_cmd
@@ -64,21 +95,60 @@ def extract_page_ocr(page: fitz.Page, dpi: int | None = None) -> tuple[str, floa
     dpi = dpi or settings.ocr_dpi
     zoom = dpi / 72.0
     mat = fitz.Matrix(zoom, zoom)
-    pix = page.get_pixmap(matrix=mat)
+    # Render straight to 8-bit grayscale: Tesseract binarizes anyway, and wrapping
+    # the raw samples avoids a PNG encode/decode round trip per page.
+    with render_lock or nullcontext():
+        pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+        img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    del pix
+
+    # One Tesseract run yields both the words and their confidences
+    ocr_data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+    return ocr_data_to_text(ocr_data)
 
-    img = Image.open(io.BytesIO(pix.tobytes("png")))
 
-    # Get detailed OCR data for confidence
-    ocr_data = pytesseract.image_to_data(img, output_type=pytesseract.Output.DICT)
+def ocr_data_to_text(ocr_data: dict[str, list]) -> tuple[str, float]:
+    """Rebuild page text and average word confidence from ``image_to_data`` output.
 
-    # Compute average confidence from words that have a valid confidence score
-    confidences = [
-        int(c) for c in ocr_data.get("conf", []) if str(c).lstrip("-").isdigit() and int(c) >= 0
-    ]
-    avg_confidence = (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0
+    Words on the same line are joined by spaces, lines by newlines, and
+    paragraphs/blocks by a blank line, matching ``image_to_string`` layout.
+
+    Returns (text, confidence) tuple.
+    """
+    parts: list[str] = []
+    confidences: list[float] = []
+    prev_para: tuple[int, int] | None = None
+    prev_line: tuple[int, int, int] | None = None
+
+    for word, conf, block, par, line in zip(
+        ocr_data.get("text", []),
+        ocr_data.get("conf", []),
+        ocr_data.get("block_num", []),
+        ocr_data.get("par_num", []),
+        ocr_data.get("line_num", []),
+    ):
+        word = str(word).strip()
+        if not word:
+            continue
+        try:
+            conf = float(conf)
+        except (TypeError, ValueError):
+            conf = -1.0
+        if conf >= 0:
+            confidences.append(conf)
+
+        if prev_line is not None:
+            if (block, par) != prev_para:
+                parts.append("\n\n")
+            elif (block, par, line) != prev_line:
+                parts.append("\n")
+            else:
+                parts.append(" ")
+        parts.append(word)
+        prev_para, prev_line = (block, par), (block, par, line)
 
-    text = pytesseract.image_to_string(img)
-    return text.strip(), avg_confidence
+    avg_confidence = (sum(confidences) / len(confidences) / 100.0) if confidences else 0.0
+    return "".join(parts), avg_confidence
 
 
 def is_image_page(text: str, min_text_length: int | None = None) -> bool:
@@ -87,65 +157,106 @@ def is_image_page(text: str, min_text_length: int | None = None) -> bool:
     return len(text.strip()) < threshold
 
 
+def _ocr_threads() -> int:
+    """Threads for OCR within one document, leaving cores to the other workers."""
+    return max(1, (os.cpu_count() or 1) // max(1, settings.worker_count))
+
+
 def extract_pages(pdf_path: Path) -> list[PageText]:
     """Extract text from all pages of a PDF document.
 
-    Uses PyMuPDF for text-layer pages and falls back to Tesseract OCR
-    for image-only pages. Each page is processed independently so one
-    bad page does not prevent extraction of others.
+    Opens the file and delegates to ``extract_pages_from_doc``; returns an
+    empty list if the PDF cannot be opened.
     """
-    results: list[PageText] = []
-
     try:
         doc = fitz.open(str(pdf_path))
     except Exception:
         logger.exception("Failed to open PDF: %s", pdf_path)
-        return results
+        return []
+
+    try:
+        return extract_pages_from_doc(doc, pdf_path)
+    finally:
+        doc.close()
+
+
+def extract_pages_from_doc(doc: fitz.Document, pdf_path: Path) -> list[PageText]:
+    """Extract text from all pages of an already open PDF document.
+
+    Uses PyMuPDF for text-layer pages and falls back to Tesseract OCR
+    for image-only pages. Each page is processed independently so one
+    bad page does not prevent extraction of others. OCR pages run on a small
+    thread pool (Tesseract works in a subprocess, so threads overlap well)
+    while native text is read from the remaining pages. ``pdf_path`` is only
+    used in log messages; the caller keeps ownership of ``doc``.
+    """
+    page_total = len(doc)
+    results: list[PageText | None] = [None] * page_total
+    doc_lock = threading.Lock()
+    ocr_jobs: list[tuple[int, str, Future[tuple[str, float]]]] = []
+    executor: ThreadPoolExecutor | None = None
 
     try:
-        for page_num in range(len(doc)):
+        for page_num in range(page_total):
             try:
-                page = doc[page_num]
-                native_text = extract_page_pymupdf(page)
+                with doc_lock:
+                    page = doc[page_num]
+                    native_text = extract_page_pymupdf(page)
 
                 if is_image_page(native_text):
                     # Fall back to OCR
-                    try:
-                        ocr_text, confidence = extract_page_ocr(page)
-                        results.append(PageText(
-                            page_num=page_num + 1,  # 1-indexed
-                            text=ocr_text,
-                            method="ocr",
-                            confidence=confidence,
-                        ))
-                    except Exception:
-                        logger.warning(
-                            "OCR failed for page %d of %s, using sparse native text",
-                            page_num + 1,
-                            pdf_path,
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=min(page_total, _ocr_threads()),
+                            thread_name_prefix="ocr",
                         )
-                        results.append(PageText(
-                            page_num=page_num + 1,
-                            text=native_text,
-                            method="pymupdf",
-                            confidence=0.5,
-                        ))
+                    # Only pages without any text layer may take the blank shortcut
+                    future = executor.submit(
+                        extract_page_ocr,
+                        page,
+                        render_lock=doc_lock,
+                        skip_blank=not native_text.strip(),
+                    )
+                    ocr_jobs.append((page_num, native_text, future))
                 else:
-                    results.append(PageText(
-                        page_num=page_num + 1,
+                    results[page_num] = PageText(
+                        page_num=page_num + 1,  # 1-indexed
                         text=native_text,
                         method="pymupdf",
                         confidence=1.0,
-                    ))
+                    )
             except Exception:
                 logger.exception("Failed to extract page %d from %s", page_num + 1, pdf_path)
-                results.append(PageText(
+                results[page_num] = PageText(
                     page_num=page_num + 1,
                     text="",
                     method="pymupdf",
                     confidence=0.0,
-                ))
+                )
+
+        for page_num, native_text, future in ocr_jobs:
+            try:
+                ocr_text, confidence = future.result()
+                results[page_num] = PageText(
+                    page_num=page_num + 1,
+                    text=ocr_text,
+                    method="ocr",
+                    confidence=confidence,
+                )
+            except Exception:
+                logger.warning(
+                    "OCR failed for page %d of %s, using sparse native text",
+                    page_num + 1,
+                    pdf_path,
+                )
+                results[page_num] = PageText(
+                    page_num=page_num + 1,
+                    text=native_text,
+                    method="pymupdf",
+                    confidence=0.5,
+                )
     finally:
-        doc.close()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
 
     return results
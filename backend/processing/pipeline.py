@@ -3,65 +3,99 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from dataclasses import dataclass
 from pathlib import Path
 
 import fitz
 
 from presidio_analyzer import AnalyzerEngine
 
-from backend.processing.extractor import extract_pages
-from backend.processing.detector import Finding, build_analyzer, detect_pii
+from backend.processing.extractor import extract_pages_from_doc
+from backend.processing.detector import Finding, detect_pii_batch, get_analyzer
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class DocumentResult:
+    """Findings and page count for one processed document."""
+
+    findings: list[Finding]
+    page_count: int
+
+
 def process_document(
     doc_path: Path,
     doc_id: str,
     analyzer: AnalyzerEngine | None = None,
-) -> list[Finding]:
+    on_page_findings: Callable[[list[Finding]], None] | None = None,
+) -> DocumentResult:
     """Process a single document: extract text per page, then detect PII.
 
+    The PDF is opened once; its page count and page text come from the same
+    handle, which is closed before PII detection starts.
+
     Args:
         doc_path: Path to the PDF file.
         doc_id: Document identifier (for logging).
         analyzer: Optional pre-built Presidio AnalyzerEngine.
-                  If None, a new one is created (useful for single-doc processing).
+                  If None, the shared process-wide analyzer is used.
+        on_page_findings: Optional callback receiving each page's findings as
+                  soon as that page is analyzed. When given, findings are
+                  handed off page by page instead of collected in the result.
 
     Returns:
-        List of all PII findings across all pages.
+        DocumentResult with all PII findings across all pages (empty when
+        ``on_page_findings`` is given) and the page count (0 if the PDF could
+        not be opened).
     """
     if analyzer is None:
-        analyzer = build_analyzer()
+        analyzer = get_analyzer()
 
     logger.info("Processing document %s: %s", doc_id, doc_path)
 
-    pages = extract_pages(doc_path)
+    try:
+        doc = fitz.open(str(doc_path))
+    except Exception:
+        logger.exception("Failed to open PDF: %s", doc_path)
+        return DocumentResult(findings=[], page_count=0)
+
+    try:
+        page_count = len(doc)
+        pages = extract_pages_from_doc(doc, doc_path)
+    finally:
+        doc.close()
+
     if not pages:
         logger.warning("No pages extracted from %s", doc_path)
-        return []
+        return DocumentResult(findings=[], page_count=page_count)
 
-    all_findings: list[Finding] = []
+    # Non-blank pages go through spaCy together in one batched pass
+    finding_count = 0
 
-    for page in pages:
-        if not page.text.strip():
-            continue
+    def _page_done(page_findings: list[Finding]) -> None:
+        nonlocal finding_count
+        finding_count += len(page_findings)
+        if on_page_findings is not None:
+            on_page_findings(page_findings)
 
-        page_findings = detect_pii(
-            text=page.text,
-            page_num=page.page_num,
-            analyzer=analyzer,
-        )
-        all_findings.extend(page_findings)
+    all_findings = detect_pii_batch(
+        [(page.page_num, page.text) for page in pages if page.text.strip()],
+        analyzer=analyzer,
+        on_page_findings=_page_done if on_page_findings is not None else None,
+    )
+    if on_page_findings is None:
+        finding_count = len(all_findings)
 
     logger.info(
         "Document %s: %d pages, %d findings",
         doc_id,
-        len(pages),
-        len(all_findings),
+        page_count,
+        finding_count,
     )
 
-    return all_findings
+    return DocumentResult(findings=all_findings, page_count=page_count)
 
 
 def get_page_count(doc_path: Path) -> int:
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from presidio_analyzer import Pattern, PatternRecognizer
 
+from backend.processing.recognizers.patterns import precompile
+
 
 class MACAddressRecognizer(PatternRecognizer):
     """Detects network MAC addresses.
@@ -13,7 +15,7 @@ class MACAddressRecognizer(PatternRecognizer):
     - Dash-separated: AA-BB-CC-DD-EE-FF
     """
 
-    PATTERNS = [
+    PATTERNS = precompile([
         Pattern(
             "mac_colon",
             r"\b[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2}){5}\b",
@@ -24,7 +26,7 @@ class MACAddressRecognizer(PatternRecognizer):
             r"\b[0-9A-Fa-f]{2}(?:-[0-9A-Fa-f]{2}){5}\b",
             0.8,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -38,10 +40,10 @@ class MACAddressRecognizer(PatternRecognizer):
 class DeviceIDRecognizer(PatternRecognizer):
     """Detects device identifiers: IMEI numbers and serial numbers near device keywords."""
 
-    PATTERNS = [
+    PATTERNS = precompile([
         Pattern(
             "imei",
-            r"(?i)IMEI[\s#:.]*\d{15}\b",
+            r"(?i)\bIMEI[\s#:.]*\d{15}\b",
             0.9,
         ),
         Pattern(
@@ -51,15 +53,15 @@ class DeviceIDRecognizer(PatternRecognizer):
         ),
         Pattern(
             "serial_number",
-            r"(?i)(?:serial\s+(?:number|no\.?)|S/?N)[\s#:.]*[A-Z0-9]{6,20}\b",
+            r"(?i)\b(?:serial\s+(?:number|no\.?)|S/?N)[\s#:.]*[A-Z0-9]{6,20}\b",
             0.75,
         ),
         Pattern(
             "device_id_keyword",
-            r"(?i)(?:device\s+(?:ID|identifier)|MEID|ESN)[\s#:.]*[A-Z0-9]{8,18}\b",
+            r"(?i)\b(?:device\s+(?:ID|identifier)|MEID|ESN)[\s#:.]*[A-Z0-9]{8,18}\b",
             0.8,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -2,9 +2,49 @@
 
 from __future__ import annotations
 
-from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult, EntityRecognizer
+import re
+
+import numpy as np
+from presidio_analyzer import Pattern, RecognizerResult, EntityRecognizer
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
+from backend.processing.recognizers.gated import KeywordGatedRecognizer
+from backend.processing.recognizers.patterns import precompile
+
+# ASCII digits only: _valid_aba_checks reads digit values straight from bytes.
+_ROUTING_RE = re.compile(r"\b([0-9]{9})\b")
+_ABA_WEIGHTS = np.array((3, 7, 1, 3, 7, 1, 3, 7, 1), dtype=np.int32)
+_ROUTING_KEYWORDS = ("routing", "aba", "transit", "bank", "wire", "ach")
+
+
+def _has_nine_digit_run(text: str) -> bool:
+    """Return True if *text* may hold nine consecutive ASCII digits.
+
+    A vectorized byte scan that is much cheaper than running _ROUTING_RE over
+    pages with no candidates. Dropping non-ASCII characters can only join
+    runs, never split them, so a False here is always safe.
+    """
+    buf = np.frombuffer(text.encode("ascii", "ignore"), dtype=np.uint8)
+    is_digit = ((buf - 48) < 10).view(np.int8)
+    if not is_digit.any():
+        return False
+    edges = np.diff(is_digit, prepend=0, append=0)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return bool(((ends - starts) >= 9).any())
+
+
+def _valid_aba_checks(candidates: list[str]) -> list[bool]:
+    """Validate the ABA check digit of every 9-digit candidate in one pass.
+
+    The candidates are packed into an (N, 9) digit matrix, so pages full of
+    9-digit runs cost one matrix-vector product rather than a Python loop
+    per candidate.
+    """
+    digits = np.frombuffer("".join(candidates).encode("ascii"), dtype=np.uint8)
+    digits = digits.reshape(-1, 9).astype(np.int32) - 48
+    return ((digits @ _ABA_WEIGHTS) % 10 == 0).tolist()
+
 
 class RoutingNumberRecognizer(EntityRecognizer):
     """Detects ABA routing numbers (9 digits with valid check digit).
@@ -27,20 +67,32 @@ class RoutingNumberRecognizer(EntityRecognizer):
     def analyze(
         self, text: str, entities: list[str], nlp_artifacts: NlpArtifacts = None
     ) -> list[RecognizerResult]:
-        import re
-
         results: list[RecognizerResult] = []
+        if not _has_nine_digit_run(text):
+            return results
+
+        matches = list(_ROUTING_RE.finditer(text))
+        if not matches:
+            return results
+
         # Look for 9-digit sequences near financial keywords
-        for match in re.finditer(r"\b(\d{9})\b", text):
-            digits = match.group(1)
-            if self._valid_aba_check(digits):
-                # Check proximity to financial keywords
+        lowered: str | None = None
+        valid = _valid_aba_checks([match.group(1) for match in matches])
+        for match, is_valid in zip(matches, valid):
+            if is_valid:
+                # Check proximity to financial keywords. The page is lowercased
+                # once, on the first candidate, and each window sliced from it;
+                # if lowercasing changed the length, offsets no longer line up.
+                if lowered is None:
+                    lowered = text.lower()
                 window_start = max(0, match.start() - 80)
                 window_end = min(len(text), match.end() + 80)
-                window = text[window_start:window_end].lower()
+                if len(lowered) == len(text):
+                    window = lowered[window_start:window_end]
+                else:
+                    window = text[window_start:window_end].lower()
 
-                keywords = ("routing", "aba", "transit", "bank", "wire", "ach")
-                if any(kw in window for kw in keywords):
+                if any(kw in window for kw in _ROUTING_KEYWORDS):
                     score = 0.85
                 else:
                     score = 0.5
@@ -56,29 +108,24 @@ class RoutingNumberRecognizer(EntityRecognizer):
 
         return results
 
-    @staticmethod
-    def _valid_aba_check(digits: str) -> bool:
-        """Validate ABA routing number check digit."""
-        d = [int(c) for c in digits]
-        checksum = 3 * (d[0] + d[3] + d[6]) + 7 * (d[1] + d[4] + d[7]) + (d[2] + d[5] + d[8])
-        return checksum % 10 == 0
-
 
-class BankAccountRecognizer(PatternRecognizer):
+class BankAccountRecognizer(KeywordGatedRecognizer):
     """Detects bank account numbers (8-17 digits near financial keywords)."""
 
-    PATTERNS = [
+    KEYWORDS = ("acct", "account")
+
+    PATTERNS = precompile([
         Pattern(
             "bank_account_keyword",
-            r"(?i)(?:account|acct)[\s#:.]*\d{8,17}\b",
+            r"(?i)\b(?:account|acct)[\s#:.]*\d{8,17}\b",
             0.75,
         ),
         Pattern(
             "bank_account_number",
-            r"(?i)(?:bank|checking|savings|deposit)\s+(?:account|acct)[\s#:.]*\d{8,17}\b",
+            r"(?i)\b(?:bank|checking|savings|deposit)\s+(?:account|acct)[\s#:.]*\d{8,17}\b",
             0.85,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -0,0 +1,48 @@
+"""Pattern recognizer base that skips its regexes when a required keyword is absent."""
+
+from __future__ import annotations
+
+import re
+
+from presidio_analyzer import PatternRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+
+class KeywordGatedRecognizer(PatternRecognizer):
+    """PatternRecognizer whose patterns all require one of a few keywords.
+
+    Subclasses set ``KEYWORDS`` to lowercase substrings, one of which appears
+    (in any case) in everything any of their patterns can match. A page
+    without any of them skips every pattern.
+
+    On ASCII text the gate is a handful of substring checks on the lowercased
+    page, which is far cheaper than even one IGNORECASE regex search; other
+    text falls back to such a search so Unicode case folding is honoured.
+    """
+
+    KEYWORDS: tuple[str, ...] = ()
+    _keyword_re: re.Pattern[str] | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.KEYWORDS:
+            cls._keyword_re = re.compile("|".join(map(re.escape, cls.KEYWORDS)), re.IGNORECASE)
+
+    def _has_keyword(self, text: str) -> bool:
+        if self._keyword_re is None:
+            return True
+        if text.isascii():
+            lowered = text.lower()
+            return any(keyword in lowered for keyword in self.KEYWORDS)
+        return self._keyword_re.search(text) is not None
+
+    def analyze(
+        self,
+        text: str,
+        entities: list[str],
+        nlp_artifacts: NlpArtifacts | None = None,
+        regex_flags: int | None = None,
+    ) -> list[RecognizerResult]:
+        if not self._has_keyword(text):
+            return []
+        return super().analyze(text, entities, nlp_artifacts, regex_flags)
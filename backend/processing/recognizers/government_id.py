@@ -4,6 +4,9 @@ from __future__ import annotations
 
 from presidio_analyzer import Pattern, PatternRecognizer
 
+from backend.processing.recognizers.gated import KeywordGatedRecognizer
+from backend.processing.recognizers.patterns import precompile
+
 
 class EnhancedSSNRecognizer(PatternRecognizer):
     """Enhanced SSN detection including partial SSN patterns.
@@ -14,7 +17,7 @@ class EnhancedSSNRecognizer(PatternRecognizer):
     - Partial (last 4 near keyword): SSN: XXXX or SSN ending in 1234
     """
 
-    PATTERNS = [
+    PATTERNS = precompile([
         Pattern(
             "ssn_full_dashes",
             r"\b(?!000|666|9\d\d)\d{3}-(?!00)\d{2}-(?!0000)\d{4}\b",
@@ -30,7 +33,7 @@ class EnhancedSSNRecognizer(PatternRecognizer):
             r"(?i)(?:SSN|social\s+security)[\s:]*(?:(?:ending\s+(?:in\s+)?)|(?:last\s+(?:four|4)\s*:?\s*))\d{4}\b",
             0.7,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -41,13 +44,15 @@ class EnhancedSSNRecognizer(PatternRecognizer):
         )
 
 
-class DriversLicenseRecognizer(PatternRecognizer):
+class DriversLicenseRecognizer(KeywordGatedRecognizer):
     """Detects US driver's license numbers for common state formats.
 
     Covers several common state patterns with proximity to keywords.
     """
 
-    PATTERNS = [
+    KEYWORDS = ("driver", "dl", "d.l")
+
+    PATTERNS = precompile([
         # General: letter followed by digits (many states)
         Pattern(
             "dl_letter_digits",
@@ -78,7 +83,7 @@ class DriversLicenseRecognizer(PatternRecognizer):
             r"(?i)(?:driver'?s?\s*license|DL)[\s#:]*\d{9}\b",
             0.7,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -89,10 +94,12 @@ class DriversLicenseRecognizer(PatternRecognizer):
         )
 
 
-class PassportRecognizer(PatternRecognizer):
+class PassportRecognizer(KeywordGatedRecognizer):
     """Detects US passport numbers (9 digits near 'passport' keyword)."""
 
-    PATTERNS = [
+    KEYWORDS = ("passport",)
+
+    PATTERNS = precompile([
         Pattern(
             "passport_9digit",
             r"(?i)passport[\s#:]*\d{9}\b",
@@ -103,7 +110,7 @@ class PassportRecognizer(PatternRecognizer):
             r"(?i)passport\s+(?:number|no\.?)[\s#:]*\d{9}\b",
             0.9,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
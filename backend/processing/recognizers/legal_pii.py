@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import re
+from bisect import bisect_left
+
+import ahocorasick
 from presidio_analyzer import Pattern, PatternRecognizer, RecognizerResult, EntityRecognizer
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
+from backend.processing.recognizers.patterns import precompile
+
 
 class CaseNumberRecognizer(PatternRecognizer):
     """Detects legal case number patterns.
@@ -15,7 +21,7 @@ class CaseNumberRecognizer(PatternRecognizer):
     - Docket No. 2024-12345
     """
 
-    PATTERNS = [
+    PATTERNS = precompile([
         Pattern(
             "case_number_dashed",
             r"\b\d{2,4}-(?:CV|CR|CIV|CRIM|MC|MJ|JV|DR|PR|AP|BK)-\d{4,8}\b",
@@ -36,7 +42,7 @@ class CaseNumberRecognizer(PatternRecognizer):
             r"(?i)\bCause\s+No\.?\s*[:\s]?\s*\d{2,4}[-\s]?\d{3,8}\b",
             0.85,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -47,11 +53,50 @@ class CaseNumberRecognizer(PatternRecognizer):
         )
 
 
-LEGAL_ROLE_KEYWORDS = (
-    r"(?i)\b(?:judge|justice|attorney|counsel|lawyer|defendant|plaintiff|"
-    r"victim|witness|minor|juvenile|suspect|respondent|petitioner|"
-    r"complainant|informant|officer|detective|agent)\b"
+_LEGAL_ROLE_WORDS = (
+    "judge", "justice", "attorney", "counsel", "lawyer", "defendant", "plaintiff",
+    "victim", "witness", "minor", "juvenile", "suspect", "respondent", "petitioner",
+    "complainant", "informant", "officer", "detective", "agent",
 )
+LEGAL_ROLE_KEYWORDS = r"\b(?:" + "|".join(_LEGAL_ROLE_WORDS) + r")\b"
+_LEGAL_ROLE_RE = re.compile(LEGAL_ROLE_KEYWORDS, re.IGNORECASE)
+
+
+def _build_automaton() -> ahocorasick.Automaton:
+    automaton = ahocorasick.Automaton()
+    for word in _LEGAL_ROLE_WORDS:
+        automaton.add_word(word, len(word))
+    automaton.make_automaton()
+    return automaton
+
+
+# One pass over the page finds every keyword at once, instead of the regex
+# engine retrying a 19-way case-insensitive alternation at each position.
+_LEGAL_ROLE_AC = _build_automaton()
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _find_legal_role_keywords(text: str) -> list[tuple[int, int]]:
+    """Return (start, end) spans of whole-word legal role keywords in *text*."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Some characters expand when lowercased; offsets would no longer line
+        # up with the original text, so fall back to the regex.
+        return [(m.start(), m.end()) for m in _LEGAL_ROLE_RE.finditer(text)]
+
+    positions: list[tuple[int, int]] = []
+    last = len(lowered) - 1
+    for end, length in _LEGAL_ROLE_AC.iter(lowered):
+        start = end - length + 1
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end < last and _is_word_char(lowered[end + 1]):
+            continue
+        positions.append((start, end + 1))
+    return positions
 
 
 class LegalRoleNameRecognizer(EntityRecognizer):
@@ -76,20 +121,27 @@ class LegalRoleNameRecognizer(EntityRecognizer):
     def analyze(
         self, text: str, entities: list[str], nlp_artifacts: NlpArtifacts = None
     ) -> list[RecognizerResult]:
-        import re
-
         results: list[RecognizerResult] = []
         if nlp_artifacts is None or nlp_artifacts.entities is None:
             return results
 
         # Find all legal role keyword positions
-        keyword_positions: list[tuple[int, int]] = []
-        for match in re.finditer(LEGAL_ROLE_KEYWORDS, text):
-            keyword_positions.append((match.start(), match.end()))
+        keyword_positions = _find_legal_role_keywords(text)
 
         if not keyword_positions:
             return results
 
+        # Keywords are whole words, so they never overlap and sorting by
+        # start also sorts by end. A keyword is in range when its end lies
+        # within WINDOW of the entity start or its start within WINDOW of
+        # the entity end; bisecting both lists finds the first such keyword
+        # in text order instead of scanning them all per entity.
+        keyword_positions.sort()
+        kw_starts = [kw_start for kw_start, _ in keyword_positions]
+        kw_ends = [kw_end for _, kw_end in keyword_positions]
+        count = len(keyword_positions)
+        window = self.WINDOW
+
         for entity in nlp_artifacts.entities:
             if entity.label_ != "PERSON":
                 continue
@@ -97,19 +149,26 @@ class LegalRoleNameRecognizer(EntityRecognizer):
             start = entity.start_char
             end = entity.end_char
 
-            # Check proximity to any legal role keyword
-            for kw_start, kw_end in keyword_positions:
-                distance = min(abs(start - kw_end), abs(kw_start - end))
-                if distance <= self.WINDOW:
-                    confidence = 0.75 if distance > 50 else 0.85
-                    results.append(
-                        RecognizerResult(
-                            entity_type="LEGAL_ROLE_NAME",
-                            start=start,
-                            end=end,
-                            score=confidence,
-                        )
-                    )
-                    break  # One match per entity
+            first = count
+            i = bisect_left(kw_ends, start - window)
+            if i < count and kw_ends[i] <= start + window:
+                first = i
+            i = bisect_left(kw_starts, end - window, 0, first)
+            if i < first and kw_starts[i] <= end + window:
+                first = i
+            if first == count:
+                continue
+
+            kw_start, kw_end = keyword_positions[first]
+            distance = min(abs(start - kw_end), abs(kw_start - end))
+            confidence = 0.75 if distance > 50 else 0.85
+            results.append(
+                RecognizerResult(
+                    entity_type="LEGAL_ROLE_NAME",
+                    start=start,
+                    end=end,
+                    score=confidence,
+                )
+            )
 
         return results
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from presidio_analyzer import Pattern, PatternRecognizer
+from presidio_analyzer import Pattern
 
+from backend.processing.recognizers.gated import KeywordGatedRecognizer
+from backend.processing.recognizers.patterns import precompile
 
-class MedicalRecordRecognizer(PatternRecognizer):
+
+class MedicalRecordRecognizer(KeywordGatedRecognizer):
     """Detects medical record numbers near relevant keywords.
 
     Matches patterns like:
@@ -14,7 +17,9 @@ class MedicalRecordRecognizer(PatternRecognizer):
     - Patient ID: 12345678
     """
 
-    PATTERNS = [
+    KEYWORDS = ("mrn", "record", "patient")
+
+    PATTERNS = precompile([
         Pattern(
             "mrn_keyword",
             r"(?i)MRN[\s#:.]*\d{5,12}\b",
@@ -35,7 +40,7 @@ class MedicalRecordRecognizer(PatternRecognizer):
             r"(?i)health\s+record[\s#:.]*(?:number|no\.?)?[\s#:.]*\d{5,12}\b",
             0.8,
         ),
-    ]
+    ])
 
     def __init__(self) -> None:
         super().__init__(
@@ -0,0 +1,146 @@
+"""Regex pattern helpers shared by the custom pattern recognizers."""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+import re2
+import regex
+from presidio_analyzer import Pattern
+
+logger = logging.getLogger(__name__)
+
+# PatternRecognizer's default global_regex_flags; patterns compiled with any
+# other flags are recompiled by Presidio on first use.
+PRESIDIO_FLAGS = regex.DOTALL | regex.MULTILINE | regex.IGNORECASE
+
+_RE2_OPTIONS = re2.Options()
+_RE2_OPTIONS.case_sensitive = False
+_RE2_OPTIONS.dot_nl = True
+_RE2_OPTIONS.log_errors = False
+_RE2_OPTIONS.never_capture = True
+
+# Unicode \s in the regex module matches these ASCII characters; RE2's \s
+# leaves out \v, so it is spelled out for RE2.
+_ASCII_SPACE = r"\t-\r "
+
+
+def _to_re2(pattern: str) -> str | None:
+    """Rewrite *pattern* for RE2, or return None if RE2 cannot express it."""
+    if "(?=" in pattern or "(?!" in pattern or "(?<" in pattern:
+        return None  # lookarounds
+    out: list[str] = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch == "\\":
+            escape = pattern[i : i + 2]
+            if escape == r"\s":
+                out.append(_ASCII_SPACE if in_class else f"[{_ASCII_SPACE}]")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if ch == "[" and not in_class:
+            in_class = True
+        elif ch == "]" and in_class:
+            in_class = False
+        out.append(ch)
+        i += 1
+    return "(?m)" + "".join(out)
+
+
+class _PatternSet:
+    """One RE2 Set over every RE2-compiled pattern, matched once per page.
+
+    Presidio hands the same page string to each recognizer in turn, and most
+    patterns match nothing on most pages. A single Set pass reports which
+    patterns match anywhere, so the others skip their own scan. The answer
+    for the last page is kept per thread and recognized by identity.
+    """
+
+    def __init__(self) -> None:
+        self._sources: list[str] = []
+        self._compiled: re2.Set | None = None
+        self._lock = threading.Lock()
+        self._last = threading.local()
+
+    def add(self, source: str) -> int:
+        with self._lock:
+            self._sources.append(source)
+            self._compiled = None
+            return len(self._sources) - 1
+
+    def _compile(self) -> re2.Set:
+        with self._lock:
+            if self._compiled is None:
+                compiled = re2.Set.SearchSet(_RE2_OPTIONS)
+                for source in self._sources:
+                    compiled.Add(source)
+                compiled.Compile()
+                self._compiled = compiled
+            return self._compiled
+
+    def matches(self, text: str, index: int) -> bool:
+        """Return True if pattern *index* matches somewhere in ASCII *text*."""
+        last = self._last
+        if getattr(last, "text", None) is not text or index >= last.count:
+            compiled = self._compiled or self._compile()
+            last.ids = frozenset(compiled.Match(text) or ())
+            last.count = len(self._sources)
+            last.text = text
+        return index in last.ids
+
+
+_PATTERN_SET = _PatternSet()
+
+
+class _AsciiRe2Regex:
+    """Compiled pattern that runs on RE2 for ASCII text.
+
+    On ASCII input RE2 gives the same matches as the regex module under
+    Presidio's flags, without backtracking, and the shared pattern set lets
+    it skip pages it cannot match. Unicode text keeps the regex module,
+    whose \\b, \\d and \\s are Unicode-aware where RE2's are not.
+    """
+
+    __slots__ = ("_fast", "_index", "_unicode")
+
+    def __init__(self, source: str, unicode: regex.Pattern) -> None:
+        self._fast = re2.compile(source, _RE2_OPTIONS)
+        self._index = _PATTERN_SET.add(source)
+        self._unicode = unicode
+
+    def finditer(self, text: str, *args, **kwargs):
+        if text.isascii():
+            if not _PATTERN_SET.matches(text, self._index):
+                return iter(())
+            return self._fast.finditer(text)
+        return self._unicode.finditer(text, *args, **kwargs)
+
+
+def precompile(patterns: list[Pattern]) -> list[Pattern]:
+    """Compile *patterns* at import, the way PatternRecognizer would lazily.
+
+    Presidio caches the compiled regex on each Pattern, and the class-level
+    PATTERNS lists are shared by every instance, so this moves the work to
+    module import: forked workers inherit the compiled patterns instead of
+    compiling them again on their first page. Patterns RE2 can express also
+    get its linear-time matcher for ASCII pages. Patterns already compiled
+    here are left alone, since Presidio's own PATTERNS lists are shared too.
+    """
+    for pattern in patterns:
+        if isinstance(pattern.compiled_regex, _AsciiRe2Regex):
+            continue
+        compiled = regex.compile(pattern.regex, flags=PRESIDIO_FLAGS)
+        re2_source = _to_re2(pattern.regex)
+        if re2_source is not None:
+            try:
+                compiled = _AsciiRe2Regex(re2_source, compiled)
+            except re2.error:
+                logger.debug("Pattern %s stays on the regex module", pattern.name)
+        pattern.compiled_regex = compiled
+        pattern.compiled_with_flags = PRESIDIO_FLAGS
+    return patterns
@@ -6,6 +6,7 @@ import logging
 import multiprocessing as mp
 import sys
 import threading
+from collections.abc import Iterable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
@@ -18,62 +19,118 @@ logger = logging.getLogger(__name__)
 _active_pools: set[mp.pool.Pool] = set()
 _pool_lock = threading.Lock()
 
+# Upper bound on documents handed to a pool process per IPC round-trip.
+# imap_unordered only yields a chunk once every document in it is done, so
+# large chunks would stall progress updates and leave workers idle at the
+# tail of a batch; a few documents per task is enough to amortize pickling.
+_MAX_CHUNKSIZE = 4
+
 
 @dataclass
 class WorkerResult:
     """Result from processing a single document in a worker."""
 
     doc_id: str
-    findings_data: list[dict]  # Serialized findings (dicts, not Finding objects)
+    # One (document_id, page_number, pii_type, confidence, context_snippet,
+    # char_offset, char_length) tuple per finding, in the findings table's
+    # column order. Tuples pickle smaller and unpickle far faster than dicts.
+    findings_data: list[tuple]
     page_count: int
     success: bool
     error: str | None = None
 
 
-# Thread-local storage for caching the Presidio analyzer per thread.
-# Avoids rebuilding the spaCy model for every document in threaded mode.
+# Per-thread Presidio analyzer. A pool process runs its initializer and tasks
+# on its main thread, so this caches one analyzer per worker in every mode.
 _thread_local = threading.local()
 
 
+def _init_worker(analyzer=None) -> None:
+    """Worker initializer: load spaCy/Presidio once per worker process or thread.
+
+    A forked worker receives the parent's already-built analyzer and shares
+    its memory pages copy-on-write. Spawned processes and pool threads load
+    their own concurrently at start-up instead of on their first document.
+    A failure is only logged: mp.Pool would otherwise keep respawning the
+    worker, and the task retries the build and reports it as a document error.
+    """
+    if analyzer is not None:
+        _thread_local.analyzer = analyzer
+        return
+    try:
+        from backend.processing.detector import build_analyzer
+
+        _thread_local.analyzer = build_analyzer()
+    except Exception:
+        logger.exception("Worker failed to build the PII analyzer")
+
+
+def _collect(
+    results: Iterable[WorkerResult], on_result: callable | None
+) -> list[WorkerResult]:
+    """Gather results as workers produce them, reporting each to on_result."""
+    collected: list[WorkerResult] = []
+    for result in results:
+        collected.append(result)
+        if on_result:
+            on_result(result)
+    return collected
+
+
+def _pool_context() -> mp.context.BaseContext:
+    """Fork on Linux so workers inherit the parent's modules and analyzer.
+
+    Windows only supports spawn, and macOS defaults to it because forking
+    there is unsafe with system frameworks; both re-import in each worker.
+    """
+    return mp.get_context("fork" if sys.platform.startswith("linux") else "spawn")
+
+
 def _worker_process_document(args: tuple[str, str]) -> WorkerResult:
     """Process a single document in a worker process or thread.
 
-    Each worker creates its own Presidio AnalyzerEngine to avoid
-    pickling issues with multiprocessing.  In threaded mode, the
-    analyzer is cached per-thread to avoid reloading spaCy for
-    every document.
+    Each worker uses its own Presidio AnalyzerEngine to avoid pickling
+    issues with multiprocessing. Pool processes and threads get it from
+    ``_init_worker``; sequential mode builds one on first use. Either way it
+    is cached per thread so spaCy is never reloaded for every document.
     """
     doc_id, doc_path_str = args
     doc_path = Path(doc_path_str)
 
     try:
         from backend.processing.detector import build_analyzer
-        from backend.processing.pipeline import process_document, get_page_count
+        from backend.processing.pipeline import process_document
 
-        # Cache analyzer per thread (helps in ThreadPoolExecutor mode)
         analyzer = getattr(_thread_local, "analyzer", None)
         if analyzer is None:
             analyzer = build_analyzer()
             _thread_local.analyzer = analyzer
-        page_count = get_page_count(doc_path)
-        findings = process_document(doc_path, doc_id, analyzer=analyzer)
-
-        findings_data = [
-            {
-                "pii_type": f.pii_type,
-                "confidence": f.confidence,
-                "start": f.start,
-                "end": f.end,
-                "page_num": f.page_num,
-                "context_snippet": f.context_snippet,
-            }
-            for f in findings
-        ]
+        # Serialize each page's findings as it completes so the Finding
+        # objects for a long document are never all alive at once.
+        findings_data: list[tuple] = []
+
+        def _serialize(page_findings: list) -> None:
+            findings_data.extend(
+                (
+                    doc_id,
+                    f.page_num,
+                    f.pii_type,
+                    f.confidence,
+                    f.context_snippet,
+                    f.start,
+                    f.end - f.start,
+                )
+                for f in page_findings
+            )
+
+        document = process_document(
+            doc_path, doc_id, analyzer=analyzer, on_page_findings=_serialize
+        )
 
         return WorkerResult(
             doc_id=doc_id,
             findings_data=findings_data,
-            page_count=page_count,
+            page_count=document.page_count,
             success=True,
         )
     except Exception as exc:
@@ -117,24 +174,36 @@ class WorkerPool:
         if getattr(sys, "frozen", False):
             return self._process_batch_threaded(doc_items, on_result=on_result)
 
-        results: list[WorkerResult] = []
+        chunksize = max(1, min(len(doc_items) // (self.worker_count * 4), _MAX_CHUNKSIZE))
 
-        pool = mp.Pool(processes=self.worker_count)
+        ctx = _pool_context()
+        initargs: tuple = ()
+        if ctx.get_start_method() == "fork":
+            from backend.processing.detector import get_analyzer
+
+            # Fork passes initargs by memory, not pickle: load spaCy once here.
+            # On failure each worker retries and reports per-document errors.
+            try:
+                initargs = (get_analyzer(),)
+            except Exception:
+                logger.exception("Failed to build the PII analyzer before forking")
+
+        pool = ctx.Pool(
+            processes=self.worker_count, initializer=_init_worker, initargs=initargs
+        )
         with _pool_lock:
             _active_pools.add(pool)
         try:
-            for result in pool.imap_unordered(_worker_process_document, doc_items):
-                results.append(result)
-                if on_result:
-                    on_result(result)
+            return _collect(
+                pool.imap_unordered(_worker_process_document, doc_items, chunksize=chunksize),
+                on_result,
+            )
         finally:
             pool.terminate()
             pool.join()
             with _pool_lock:
                 _active_pools.discard(pool)
 
-        return results
-
     def _process_batch_threaded(
         self,
         doc_items: list[tuple[str, str]],
@@ -146,21 +215,13 @@ class WorkerPool:
         Tesseract OCR runs as a subprocess (releases GIL), so threads give
         good throughput for scanned documents.
         """
-        results: list[WorkerResult] = []
         logger.info("Frozen mode: using thread pool (%d workers)", self.worker_count)
 
-        with ThreadPoolExecutor(max_workers=self.worker_count) as executor:
-            futures = {
-                executor.submit(_worker_process_document, item): item
-                for item in doc_items
-            }
-            for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
-                if on_result:
-                    on_result(result)
-
-        return results
+        with ThreadPoolExecutor(
+            max_workers=self.worker_count, initializer=_init_worker
+        ) as executor:
+            futures = [executor.submit(_worker_process_document, item) for item in doc_items]
+            return _collect((future.result() for future in as_completed(futures)), on_result)
 
     def process_batch_sequential(
         self,
@@ -171,15 +232,27 @@ class WorkerPool:
 
         Same interface as process_batch but runs in the current process.
         """
-        results: list[WorkerResult] = []
+        return _collect(map(_worker_process_document, doc_items), on_result)
+
 
-        for item in doc_items:
-            result = _worker_process_document(item)
-            results.append(result)
-            if on_result:
-                on_result(result)
+def warm_up() -> bool:
+    """Load what the first batch needs ahead of it. Returns False on failure.
 
-        return results
+    Importing Presidio and spaCy takes seconds, and every pool mode shares
+    that import once it is in the parent. Forking pools also hand workers
+    the parent's analyzer, so it is built here too; spawned processes and
+    pool threads build their own, and a parent copy would only cost memory.
+    Meant to run in a background thread while the server is already serving.
+    """
+    try:
+        from backend.processing import detector
+
+        if not getattr(sys, "frozen", False) and _pool_context().get_start_method() == "fork":
+            detector.get_analyzer()
+    except Exception:
+        logger.exception("Failed to warm up the PII analyzer")
+        return False
+    return True
 
 
 def shutdown_all_pools() -> None:
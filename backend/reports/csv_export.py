@@ -5,48 +5,50 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
-
-def generate_csv(data: dict, output_path: Path) -> None:
-    """Generate a flat CSV export with one row per finding.
+from backend.core.database import db
+
+CSV_FIELDNAMES = [
+    "batch_name",
+    "document_filename",
+    "page_number",
+    "pii_type",
+    "confidence",
+    "context_snippet",
+    "char_offset",
+    "char_length",
+]
+
+# Selects a batch's findings already in CSV_FIELDNAMES order, by document
+# (filename, then id for duplicate names), page and position. Shared by the
+# CSV report and the streamed findings.csv download so both order rows alike.
+CSV_ROWS_SQL = (
+    "SELECT b.name, d.filename, f.page_number, f.pii_type, f.confidence, "
+    "f.context_snippet, f.char_offset, f.char_length "
+    "FROM findings f "
+    "JOIN documents d ON f.document_id = d.id "
+    "JOIN batches b ON d.batch_id = b.id "
+    "WHERE d.batch_id = ? "
+    "ORDER BY d.filename, d.id, f.page_number, f.char_offset"
+)
+
+
+def generate_csv_streaming(batch_id: str, output_path: Path) -> None:
+    """Write a flat CSV export, one row per finding, straight from a database cursor.
+
+    Rows go from SQLite to ``writer.writerows`` as plain tuples, so memory
+    stays flat however many findings the batch has.
 
     Args:
-        data: Report data from generator._fetch_batch_data().
+        batch_id: The batch to export.
         output_path: Where to write the CSV.
     """
-    batch = data["batch"]
-    documents = data["documents"]
-    findings_by_doc = data["findings_by_doc"]
-
-    # Build a lookup for document filename by id
-    doc_lookup = {d["id"]: d["filename"] for d in documents}
-
-    fieldnames = [
-        "batch_name",
-        "document_filename",
-        "page_number",
-        "pii_type",
-        "confidence",
-        "context_snippet",
-        "char_offset",
-        "char_length",
-    ]
-
-    with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for doc_info in documents:
-            doc_id = doc_info["id"]
-            doc_findings = findings_by_doc.get(doc_id, [])
-
-            for f in doc_findings:
-                writer.writerow({
-                    "batch_name": batch["name"],
-                    "document_filename": doc_lookup.get(f["document_id"], "unknown"),
-                    "page_number": f["page_number"],
-                    "pii_type": f["pii_type"],
-                    "confidence": f["confidence"],
-                    "context_snippet": f["context_snippet"],
-                    "char_offset": f["char_offset"],
-                    "char_length": f["char_length"],
-                })
+    with db.get_reader() as conn, open(
+        output_path, "w", newline="", encoding="utf-8"
+    ) as csvfile:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(CSV_ROWS_SQL, (batch_id,))
+
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_FIELDNAMES)
+        writer.writerows(cursor)
@@ -2,23 +2,30 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 from backend.core.config import settings
 from backend.core.database import db
 
 
+def _fetch_batch(conn: sqlite3.Connection, batch_id: str) -> sqlite3.Row:
+    """Fetch a batch row, raising ValueError if it does not exist."""
+    batch = conn.execute(
+        "SELECT id, name, source_path, created_at, status, "
+        "total_docs, processed_docs, docs_with_findings "
+        "FROM batches WHERE id = ?",
+        (batch_id,),
+    ).fetchone()
+    if batch is None:
+        raise ValueError(f"Batch not found: {batch_id}")
+    return batch
+
+
 def _fetch_batch_data(batch_id: str) -> dict:
     """Fetch all data needed for a report."""
-    with db.get_connection() as conn:
-        batch = conn.execute(
-            "SELECT id, name, source_path, created_at, status, "
-            "total_docs, processed_docs, docs_with_findings "
-            "FROM batches WHERE id = ?",
-            (batch_id,),
-        ).fetchone()
-        if batch is None:
-            raise ValueError(f"Batch not found: {batch_id}")
+    with db.get_reader() as conn:
+        batch = _fetch_batch(conn, batch_id)
 
         documents = conn.execute(
             "SELECT id, batch_id, filename, page_count, status, finding_count, processed_at "
@@ -59,11 +66,18 @@ def generate_report(batch_id: str, fmt: str) -> Path:
     Returns:
         Path to the generated report file.
     """
-    data = _fetch_batch_data(batch_id)
+    # The CSV export streams findings itself; only the PDF needs them loaded
+    if fmt == "csv":
+        data = None
+        with db.get_reader() as conn:
+            batch = _fetch_batch(conn, batch_id)
+    else:
+        data = _fetch_batch_data(batch_id)
+        batch = data["batch"]
     settings.ensure_dirs()
     reports_dir = settings.resolved_reports_dir
 
-    batch_name = data["batch"]["name"].replace(" ", "_")
+    batch_name = batch["name"].replace(" ", "_")
 
     if fmt == "pdf":
         from backend.reports.pdf_report import generate_pdf
@@ -72,11 +86,11 @@ def generate_report(batch_id: str, fmt: str) -> Path:
         output_path = reports_dir / filename
         generate_pdf(data, output_path)
     elif fmt == "csv":
-        from backend.reports.csv_export import generate_csv
+        from backend.reports.csv_export import generate_csv_streaming
 
         filename = f"RedactQC_{batch_name}_{batch_id[:8]}.csv"
         output_path = reports_dir / filename
-        generate_csv(data, output_path)
+        generate_csv_streaming(batch_id, output_path)
     else:
         raise ValueError(f"Unsupported report format: {fmt}")
 
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
+import re2
 
-from backend.processing.detector import Finding, detect_pii, extract_context
+from backend.processing import detector
+from backend.processing.detector import (
+    Finding,
+    build_analyzer,
+    detect_pii,
+    detect_pii_batch,
+    extract_context,
+    get_analyzer,
+)
 
 
 class TestExtractContext:
@@ -58,11 +68,7 @@ class TestDetectPII:
     def test_findings_returned_with_context(self, mock_analyzer):
         text = "Contact me at john.doe@example.com for details."
 
-        mock_result = MagicMock()
-        mock_result.entity_type = "EMAIL_ADDRESS"
-        mock_result.score = 0.95
-        mock_result.start = 14
-        mock_result.end = 34
+        mock_result = SimpleNamespace(entity_type="EMAIL_ADDRESS", score=0.95, start=14, end=34)
 
         mock_analyzer.analyze.return_value = [mock_result]
 
@@ -79,11 +85,7 @@ class TestDetectPII:
     def test_below_threshold_filtered(self, mock_analyzer):
         text = "Some text with possible PII."
 
-        mock_result = MagicMock()
-        mock_result.entity_type = "PERSON"
-        mock_result.score = 0.2
-        mock_result.start = 0
-        mock_result.end = 4
+        mock_result = SimpleNamespace(entity_type="PERSON", score=0.2, start=0, end=4)
 
         mock_analyzer.analyze.return_value = [mock_result]
 
@@ -93,17 +95,9 @@ class TestDetectPII:
     def test_multiple_findings(self, mock_analyzer):
         text = "SSN: 123-45-6789, Email: test@example.com"
 
-        result1 = MagicMock()
-        result1.entity_type = "US_SSN"
-        result1.score = 0.85
-        result1.start = 5
-        result1.end = 16
+        result1 = SimpleNamespace(entity_type="US_SSN", score=0.85, start=5, end=16)
 
-        result2 = MagicMock()
-        result2.entity_type = "EMAIL_ADDRESS"
-        result2.score = 0.95
-        result2.start = 25
-        result2.end = 41
+        result2 = SimpleNamespace(entity_type="EMAIL_ADDRESS", score=0.95, start=25, end=41)
 
         mock_analyzer.analyze.return_value = [result1, result2]
 
@@ -121,11 +115,7 @@ class TestDetectPII:
     def test_custom_threshold(self, mock_analyzer):
         text = "John Smith at 555-1234"
 
-        result = MagicMock()
-        result.entity_type = "PHONE_NUMBER"
-        result.score = 0.6
-        result.start = 14
-        result.end = 22
+        result = SimpleNamespace(entity_type="PHONE_NUMBER", score=0.6, start=14, end=22)
 
         mock_analyzer.analyze.return_value = [result]
 
@@ -136,3 +126,142 @@ class TestDetectPII:
         # Above custom threshold
         findings = detect_pii(text, page_num=1, analyzer=mock_analyzer, threshold=0.5)
         assert len(findings) == 1
+
+    def test_digit_free_text_skips_digit_entities(self, mock_analyzer):
+        mock_analyzer.get_supported_entities.return_value = ["PERSON", "US_SSN", "EMAIL_ADDRESS"]
+        mock_analyzer.analyze.return_value = []
+
+        detect_pii("Signed by the clerk", page_num=1, analyzer=mock_analyzer)
+        detect_pii("SSN 123-45-6789", page_num=1, analyzer=mock_analyzer)
+
+        first, second = mock_analyzer.analyze.call_args_list
+        assert first.kwargs["entities"] == ["PERSON", "EMAIL_ADDRESS"]
+        assert second.kwargs["entities"] is None
+
+    def test_short_digit_runs_skip_long_number_entities(self, mock_analyzer):
+        mock_analyzer.get_supported_entities.return_value = [
+            "PERSON", "US_SSN", "US_BANK_NUMBER", "ROUTING_NUMBER"
+        ]
+        mock_analyzer.analyze.return_value = []
+
+        detect_pii("SSN 123-45-6789", page_num=1, analyzer=mock_analyzer)
+        detect_pii("Account 1234567890", page_num=1, analyzer=mock_analyzer)
+
+        first, second = mock_analyzer.analyze.call_args_list
+        assert first.kwargs["entities"] == ["PERSON", "US_SSN"]
+        assert second.kwargs["entities"] is None
+
+
+class TestDetectPIIBatch:
+    """Tests for batched PII detection across pages."""
+
+    @pytest.fixture
+    def mock_analyzer(self):
+        analyzer = MagicMock()
+        analyzer.nlp_engine.process_batch.side_effect = lambda texts, language, batch_size: (
+            (text, f"artifacts:{text}") for text in texts
+        )
+        return analyzer
+
+    def _result(self, entity_type, score, start, end):
+        return SimpleNamespace(entity_type=entity_type, score=score, start=start, end=end)
+
+    def test_nlp_artifacts_passed_per_page(self, mock_analyzer):
+        mock_analyzer.analyze.side_effect = [
+            [self._result("US_SSN", 0.85, 5, 16)],
+            [self._result("EMAIL_ADDRESS", 0.95, 0, 16)],
+        ]
+
+        findings = detect_pii_batch(
+            [(1, "SSN: 123-45-6789"), (4, "test@example.com")], analyzer=mock_analyzer
+        )
+
+        assert [(f.page_num, f.pii_type) for f in findings] == [(1, "US_SSN"), (4, "EMAIL_ADDRESS")]
+        mock_analyzer.nlp_engine.process_batch.assert_called_once()
+        artifacts = [c.kwargs["nlp_artifacts"] for c in mock_analyzer.analyze.call_args_list]
+        assert artifacts == ["artifacts:SSN: 123-45-6789", "artifacts:test@example.com"]
+
+    def test_blank_pages_skipped(self, mock_analyzer):
+        assert detect_pii_batch([(1, ""), (2, "  \n")], analyzer=mock_analyzer) == []
+        mock_analyzer.nlp_engine.process_batch.assert_not_called()
+
+    def test_falls_back_to_per_page_on_nlp_failure(self, mock_analyzer):
+        mock_analyzer.nlp_engine.process_batch.side_effect = RuntimeError("pipe error")
+        mock_analyzer.analyze.return_value = [self._result("PERSON", 0.9, 0, 4)]
+
+        findings = detect_pii_batch([(1, "John here"), (2, "Jane here")], analyzer=mock_analyzer)
+
+        assert [f.page_num for f in findings] == [1, 2]
+        for c in mock_analyzer.analyze.call_args_list:
+            assert c.kwargs["nlp_artifacts"] is None
+
+    def test_repeated_text_analyzed_once(self, mock_analyzer):
+        mock_analyzer.analyze.return_value = [self._result("PERSON", 0.9, 0, 4)]
+
+        findings = detect_pii_batch(
+            [(1, "John signed"), (2, "Jane signed"), (3, "John signed")], analyzer=mock_analyzer
+        )
+
+        assert [f.page_num for f in findings] == [1, 2, 3]
+        assert mock_analyzer.analyze.call_count == 2
+        texts = mock_analyzer.nlp_engine.process_batch.call_args.args[0]
+        assert texts == ["John signed", "Jane signed"]
+
+    def test_cached_pages_skip_nlp(self, mock_analyzer):
+        mock_analyzer.analyze.return_value = [self._result("PERSON", 0.9, 0, 4)]
+        detect_pii_batch([(1, "John signed")], analyzer=mock_analyzer)
+
+        findings = detect_pii_batch([(7, "John signed")], analyzer=mock_analyzer, threshold=0.5)
+
+        assert [(f.page_num, f.pii_type) for f in findings] == [(7, "PERSON")]
+        mock_analyzer.nlp_engine.process_batch.assert_called_once()
+        mock_analyzer.analyze.assert_called_once()
+
+    def test_page_findings_streamed_to_callback(self, mock_analyzer):
+        mock_analyzer.analyze.side_effect = [
+            [self._result("US_SSN", 0.85, 5, 16)],
+            [],
+        ]
+        pages_seen = []
+
+        findings = detect_pii_batch(
+            [(1, "SSN: 123-45-6789"), (2, "nothing")],
+            analyzer=mock_analyzer,
+            on_page_findings=pages_seen.append,
+        )
+
+        assert findings == []
+        assert [[f.page_num for f in page] for page in pages_seen] == [[1], []]
+
+
+class TestGetAnalyzer:
+    """Tests for the shared analyzer."""
+
+    @patch("backend.processing.detector.build_analyzer")
+    def test_builds_once(self, mock_build):
+        mock_build.return_value = MagicMock()
+        with patch.object(detector, "_analyzer", None):
+            first = get_analyzer()
+            second = get_analyzer()
+
+        assert first is second is mock_build.return_value
+        mock_build.assert_called_once()
+
+
+class TestBuildAnalyzer:
+    """Tests for analyzer construction."""
+
+    @patch("backend.processing.detector.AnalyzerEngine")
+    @patch("backend.processing.detector._load_spacy_model")
+    def test_predefined_patterns_precompiled(self, mock_load, mock_engine):
+        build_analyzer()
+        registry = mock_engine.call_args.kwargs["registry"]
+        email = next(
+            r for r in registry.recognizers if "EMAIL_ADDRESS" in r.supported_entities
+        )
+        text = "Write to jane.doe@example.com today."
+        with patch.object(re2.Set, "Match", autospec=True, side_effect=re2.Set.Match) as match:
+            spans = [m.span() for m in email.patterns[0].compiled_regex.finditer(text)]
+        assert spans == [(9, 29)]
+        match.assert_called_once()
+
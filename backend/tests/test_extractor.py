@@ -5,13 +5,16 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz
 import pytest
 
 from backend.processing.extractor import (
     PageText,
+    extract_page_ocr,
     extract_page_pymupdf,
     extract_pages,
     is_image_page,
+    ocr_data_to_text,
 )
 
 
@@ -54,6 +57,77 @@ class TestExtractPagePyMuPDF:
         assert extract_page_pymupdf(page) == ""
 
 
+class TestExtractPageOcr:
+    """Tests for the OCR path."""
+
+    @patch("pytesseract.image_to_data")
+    def test_blank_page_skips_tesseract(self, mock_data):
+        doc = fitz.open()
+        page = doc.new_page()
+        assert extract_page_ocr(page) == ("", 0.0)
+        mock_data.assert_not_called()
+        doc.close()
+
+    @pytest.mark.parametrize("fontsize", [7, 8, 9])
+    @patch("pytesseract.image_to_data")
+    def test_sparse_scanned_page_runs_tesseract(self, mock_data, fontsize):
+        """A scan holding one small line of text is not mistaken for a blank page."""
+        mock_data.return_value = {"text": [], "conf": [], "block_num": [],
+                                  "par_num": [], "line_num": []}
+        source = fitz.open()
+        source.new_page().insert_text((72, 100), "SSN: 123-45-6789", fontsize=fontsize)
+        scan = source[0].get_pixmap(dpi=300, colorspace=fitz.csGRAY)
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=scan)  # image only, no text layer
+        extract_page_ocr(page, dpi=72)
+        mock_data.assert_called_once()
+        doc.close()
+        source.close()
+
+    @patch("pytesseract.image_to_data")
+    def test_skip_blank_off_runs_tesseract(self, mock_data):
+        mock_data.return_value = {"text": [], "conf": [], "block_num": [],
+                                  "par_num": [], "line_num": []}
+        doc = fitz.open()
+        page = doc.new_page()
+        assert extract_page_ocr(page, dpi=72, skip_blank=False) == ("", 0.0)
+        mock_data.assert_called_once()
+        doc.close()
+
+    @patch("pytesseract.image_to_data")
+    def test_inked_page_runs_tesseract(self, mock_data):
+        mock_data.return_value = {"text": ["Scan"], "conf": [90], "block_num": [1],
+                                  "par_num": [1], "line_num": [1]}
+        doc = fitz.open()
+        page = doc.new_page()
+        page.draw_rect(fitz.Rect(72, 72, 300, 200), color=(0, 0, 0), fill=(0, 0, 0))
+        assert extract_page_ocr(page, dpi=72) == ("Scan", pytest.approx(0.9))
+        mock_data.assert_called_once()
+        doc.close()
+
+
+class TestOcrDataToText:
+    """Tests for rebuilding OCR text from image_to_data output."""
+
+    def test_lines_and_paragraphs(self):
+        ocr_data = {
+            "text": ["", "", "", "John", "Smith", "", "SSN", "", "", "Page", "two"],
+            "conf": [-1, -1, -1, 96, 90, -1, 84, -1, -1, 80, "70.0"],
+            "block_num": [1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 2],
+            "par_num": [0, 1, 1, 1, 1, 1, 1, 0, 1, 1, 1],
+            "line_num": [0, 0, 1, 1, 1, 2, 2, 0, 0, 1, 1],
+        }
+        text, confidence = ocr_data_to_text(ocr_data)
+        assert text == "John Smith\nSSN\n\nPage two"
+        assert confidence == pytest.approx(0.84)
+
+    def test_no_words(self):
+        ocr_data = {"text": ["", " "], "conf": [-1, -1], "block_num": [1, 1],
+                    "par_num": [0, 1], "line_num": [0, 0]}
+        assert ocr_data_to_text(ocr_data) == ("", 0.0)
+
+
 class TestExtractPages:
     """Tests for full document extraction."""
 
@@ -100,6 +174,24 @@ class TestExtractPages:
         assert results[0].confidence == 0.92
         assert "OCR extracted" in results[0].text
 
+    @patch("pytesseract.image_to_data")
+    def test_tiny_text_layer_is_ocrd(self, mock_data, tmp_path):
+        """A sparse text page that looks blank at 72 DPI still goes to Tesseract."""
+        mock_data.return_value = {"text": ["123-45-6789"], "conf": [91], "block_num": [1],
+                                  "par_num": [1], "line_num": [1]}
+        pdf_path = tmp_path / "tiny.pdf"
+        doc = fitz.open()
+        page = doc.new_page()
+        page.insert_text((72, 72), "123-45-6789", fontsize=7)
+        doc.save(pdf_path)
+        doc.close()
+
+        results = extract_pages(pdf_path)
+
+        mock_data.assert_called_once()
+        assert results[0].method == "ocr"
+        assert results[0].text == "123-45-6789"
+
     @patch("backend.processing.extractor.fitz")
     def test_failed_open_returns_empty(self, mock_fitz):
         """Test that a failed PDF open returns an empty list."""
@@ -15,8 +15,14 @@ from backend.processing.pipeline import process_document, get_page_count
 class TestProcessDocument:
     """Tests for the document processing pipeline."""
 
-    @patch("backend.processing.pipeline.detect_pii")
-    @patch("backend.processing.pipeline.extract_pages")
+    @pytest.fixture(autouse=True)
+    def mock_fitz(self):
+        with patch("backend.processing.pipeline.fitz") as mock_fitz:
+            mock_fitz.open.return_value.__len__.return_value = 3
+            yield mock_fitz
+
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
     def test_basic_processing(self, mock_extract, mock_detect):
         """Test that pages are extracted and PII detected."""
         mock_extract.return_value = [
@@ -28,26 +34,32 @@ class TestProcessDocument:
             pii_type="US_SSN", confidence=0.85, start=15, end=26,
             page_num=1, context_snippet="Smith SSN 123-45-6789",
         )
-        mock_detect.side_effect = [[finding1], []]
+        mock_detect.return_value = [finding1]
 
         analyzer = MagicMock()
-        results = process_document(Path("/fake/doc.pdf"), "doc-1", analyzer=analyzer)
+        results = process_document(Path("/fake/doc.pdf"), "doc-1", analyzer=analyzer).findings
 
         assert len(results) == 1
         assert results[0].pii_type == "US_SSN"
         assert results[0].page_num == 1
+        # Both pages are analyzed in a single batched call
+        mock_detect.assert_called_once()
+        assert mock_detect.call_args.args[0] == [
+            (1, "John Smith SSN 123-45-6789"),
+            (2, "More text on page two here."),
+        ]
 
-    @patch("backend.processing.pipeline.extract_pages")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
     def test_no_pages_returns_empty(self, mock_extract):
         """Test that a document with no extractable pages returns empty."""
         mock_extract.return_value = []
 
         analyzer = MagicMock()
-        results = process_document(Path("/fake/empty.pdf"), "doc-2", analyzer=analyzer)
-        assert results == []
+        result = process_document(Path("/fake/empty.pdf"), "doc-2", analyzer=analyzer)
+        assert result.findings == []
 
-    @patch("backend.processing.pipeline.detect_pii")
-    @patch("backend.processing.pipeline.extract_pages")
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
     def test_empty_pages_skipped(self, mock_extract, mock_detect):
         """Test that pages with no text content are skipped."""
         mock_extract.return_value = [
@@ -61,11 +73,12 @@ class TestProcessDocument:
         analyzer = MagicMock()
         process_document(Path("/fake/doc.pdf"), "doc-3", analyzer=analyzer)
 
-        # detect_pii should only be called for page 3
-        assert mock_detect.call_count == 1
+        # Only page 3 should be passed on for detection
+        mock_detect.assert_called_once()
+        assert mock_detect.call_args.args[0] == [(3, "Real content here.")]
 
-    @patch("backend.processing.pipeline.detect_pii")
-    @patch("backend.processing.pipeline.extract_pages")
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
     def test_multiple_findings_per_page(self, mock_extract, mock_detect):
         """Test that multiple findings per page are all collected."""
         mock_extract.return_value = [
@@ -90,22 +103,65 @@ class TestProcessDocument:
         mock_detect.return_value = findings
 
         analyzer = MagicMock()
-        results = process_document(Path("/fake/doc.pdf"), "doc-4", analyzer=analyzer)
+        results = process_document(Path("/fake/doc.pdf"), "doc-4", analyzer=analyzer).findings
 
         assert len(results) == 2
         assert results[0].pii_type == "EMAIL_ADDRESS"
         assert results[1].pii_type == "PHONE_NUMBER"
 
-    @patch("backend.processing.pipeline.build_analyzer")
-    @patch("backend.processing.pipeline.detect_pii")
-    @patch("backend.processing.pipeline.extract_pages")
-    def test_creates_analyzer_if_none(self, mock_extract, mock_detect, mock_build):
-        """Test that an analyzer is created if none is provided."""
+    @patch("backend.processing.pipeline.get_analyzer")
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
+    def test_uses_shared_analyzer_if_none(self, mock_extract, mock_detect, mock_get):
+        """Test that the shared analyzer is used if none is provided."""
         mock_extract.return_value = []
-        mock_build.return_value = MagicMock()
+        mock_get.return_value = MagicMock()
 
         process_document(Path("/fake/doc.pdf"), "doc-5")
-        mock_build.assert_called_once()
+        mock_get.assert_called_once()
+
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
+    def test_pdf_opened_once(self, mock_extract, mock_detect, mock_fitz):
+        """Page count and page text come from a single open of the PDF."""
+        mock_extract.return_value = []
+
+        result = process_document(Path("/fake/doc.pdf"), "doc-6", analyzer=MagicMock())
+
+        assert result.page_count == 3
+        mock_fitz.open.assert_called_once_with("/fake/doc.pdf")
+        mock_extract.assert_called_once_with(mock_fitz.open.return_value, Path("/fake/doc.pdf"))
+        mock_fitz.open.return_value.close.assert_called_once()
+
+    @patch("backend.processing.pipeline.detect_pii_batch")
+    @patch("backend.processing.pipeline.extract_pages_from_doc")
+    def test_streams_page_findings(self, mock_extract, mock_detect):
+        """With on_page_findings, findings go to the callback, not the result."""
+        mock_extract.return_value = [
+            PageText(page_num=1, text="SSN 123-45-6789", method="pymupdf", confidence=1.0),
+        ]
+        finding = Finding(
+            pii_type="US_SSN", confidence=0.85, start=4, end=15,
+            page_num=1, context_snippet="SSN 123-45-6789",
+        )
+        mock_detect.side_effect = lambda pages, analyzer, on_page_findings: (
+            on_page_findings([finding]) or []
+        )
+        received = []
+
+        result = process_document(
+            Path("/fake/doc.pdf"), "doc-8", analyzer=MagicMock(), on_page_findings=received.extend
+        )
+
+        assert received == [finding]
+        assert result.findings == []
+
+    def test_open_failure_returns_empty(self, mock_fitz):
+        mock_fitz.open.side_effect = RuntimeError("bad file")
+
+        result = process_document(Path("/fake/bad.pdf"), "doc-7", analyzer=MagicMock())
+        assert result.findings == []
+        assert result.page_count == 0
 
 
 class TestGetPageCount:
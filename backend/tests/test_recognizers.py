@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
+import re2
+from presidio_analyzer import PatternRecognizer
 
 from backend.processing.recognizers.legal_pii import (
     CaseNumberRecognizer,
@@ -64,6 +67,12 @@ class TestCaseNumberRecognizer:
         results = _run_pattern_recognizer(recognizer, text)
         assert len(results) == 0
 
+    def test_non_ascii_whitespace(self, recognizer):
+        # Non-ASCII pages skip RE2, whose \s would not match a no-break space
+        text = "Case No.\u00a02024-567890 was filed on Monday."
+        results = _run_pattern_recognizer(recognizer, text)
+        assert len(results) >= 1
+
 
 class TestLegalRoleNameRecognizer:
     """Tests for legal role name detection."""
@@ -73,17 +82,10 @@ class TestLegalRoleNameRecognizer:
         return LegalRoleNameRecognizer()
 
     def _make_nlp_artifacts(self, entities):
-        artifacts = MagicMock()
-        artifacts.entities = entities
-        return artifacts
+        return SimpleNamespace(entities=entities)
 
     def _make_spacy_entity(self, text, start, end, label="PERSON"):
-        entity = MagicMock()
-        entity.label_ = label
-        entity.start_char = start
-        entity.end_char = end
-        entity.text = text
-        return entity
+        return SimpleNamespace(label_=label, start_char=start, end_char=end, text=text)
 
     def test_judge_name(self, recognizer):
         text = "The Honorable Judge John Smith presided over the case."
@@ -225,6 +227,24 @@ class TestRoutingNumberRecognizer:
         results = recognizer.analyze(text, ["ROUTING_NUMBER"])
         assert len(results) == 0  # Fails ABA check
 
+    def test_non_ascii_digits_ignored(self, recognizer):
+        # Fullwidth 021000021 — the check digit kernel only reads ASCII digits
+        text = "Bank routing number: ０２１００００２１."
+        assert recognizer.analyze(text, ["ROUTING_NUMBER"]) == []
+
+    def test_short_digit_runs_skip_regex(self, recognizer):
+        text = "Bank statement page 12 of 40, dated 2024-01-02, ref 12345678."
+        with patch("backend.processing.recognizers.financial_pii._ROUTING_RE") as routing_re:
+            assert recognizer.analyze(text, ["ROUTING_NUMBER"]) == []
+        routing_re.finditer.assert_not_called()
+
+    def test_many_candidates_validated_together(self, recognizer):
+        # Only 021000021 and 011000015 have valid check digits
+        text = "ACH batch: " + " ".join(["021000021", "123456789", "011000015"] * 40)
+        results = recognizer.analyze(text, ["ROUTING_NUMBER"])
+        assert len(results) == 80
+        assert {text[r.start:r.end] for r in results} == {"021000021", "011000015"}
+
 
 class TestBankAccountRecognizer:
     """Tests for bank account number detection."""
@@ -243,6 +263,10 @@ class TestBankAccountRecognizer:
         results = _run_pattern_recognizer(recognizer, text)
         assert len(results) >= 1
 
+    def test_keyword_inside_word_ignored(self, recognizer):
+        text = "Subaccount 12345678901 was closed."
+        assert _run_pattern_recognizer(recognizer, text) == []
+
 
 class TestMedicalRecordRecognizer:
     """Tests for medical record number detection."""
@@ -311,3 +335,58 @@ class TestDeviceIDRecognizer:
         text = "Device ID: A1B2C3D4E5F6 was registered."
         results = _run_pattern_recognizer(recognizer, text)
         assert len(results) >= 1
+
+    def test_keyword_inside_word_ignored(self, recognizer):
+        text = "Exhibit PRESN ABCD12345 was marked."
+        assert _run_pattern_recognizer(recognizer, text) == []
+
+    @pytest.mark.parametrize(
+        ("recognizer_cls", "identifier"),
+        [(BankAccountRecognizer, "Account# 12345678901"),
+         (DeviceIDRecognizer, "Device ID: A1B2C3D4E5F6")],
+    )
+    def test_single_match_on_large_page(self, recognizer_cls, identifier):
+        filler = "The witness described the events of that evening in detail. " * 800
+        text = f"{filler}{identifier} {filler}"
+        assert len(_run_pattern_recognizer(recognizer_cls(), text)) == 1
+
+
+class TestKeywordGate:
+    """Tests for skipping keyword-anchored patterns on pages without the keyword."""
+
+    @pytest.mark.parametrize(
+        "recognizer_cls",
+        [DriversLicenseRecognizer, PassportRecognizer, BankAccountRecognizer,
+         MedicalRecordRecognizer],
+    )
+    def test_patterns_skipped_without_keyword(self, recognizer_cls):
+        recognizer = recognizer_cls()
+        with patch.object(PatternRecognizer, "analyze") as mock_analyze:
+            results = _run_pattern_recognizer(recognizer, "The court recessed. 123456789")
+        assert results == []
+        mock_analyze.assert_not_called()
+
+    def test_keyword_case_insensitive(self):
+        text = "PASSPORT 123456789 was presented."
+        assert len(_run_pattern_recognizer(PassportRecognizer(), text)) >= 1
+
+    def test_non_ascii_text_uses_case_folding(self):
+        # Long s (U+017F) case-folds to "s", so the patterns match "paſſport"
+        text = "paſſport 123456789 was presented."
+        assert len(_run_pattern_recognizer(PassportRecognizer(), text)) >= 1
+
+
+class TestPatternSet:
+    """Tests for the shared RE2 set that screens pages before pattern scans."""
+
+    def test_page_screened_once_across_recognizers(self):
+        text = "Router MAC 00:1A:2B:3C:4D:5E logged; no device keywords."
+        with patch.object(re2.Set, "Match", autospec=True, side_effect=re2.Set.Match) as match:
+            mac_results = _run_pattern_recognizer(MACAddressRecognizer(), text)
+            device_results = _run_pattern_recognizer(DeviceIDRecognizer(), text)
+            case_results = _run_pattern_recognizer(CaseNumberRecognizer(), text)
+        assert match.call_count == 1
+        assert len(mac_results) == 1
+        assert device_results == []
+        assert case_results == []
+
@@ -76,10 +76,11 @@ export const api = {
   // Findings
   getFindings(
     docId: string,
-    params?: { page?: number; page_size?: number; pii_type?: string; min_confidence?: number }
+    params?: { page?: number; page_size?: number; pii_type?: string; min_confidence?: number; cursor?: string }
   ): Promise<PaginatedResponse<Finding>> {
     const qs = new URLSearchParams();
     if (params?.page) qs.set('page', String(params.page));
+    if (params?.cursor) qs.set('cursor', params.cursor);
     if (params?.page_size) qs.set('page_size', String(params.page_size));
     if (params?.pii_type) qs.set('pii_type', params.pii_type);
     if (params?.min_confidence) qs.set('min_confidence', String(params.min_confidence));
@@ -107,4 +108,8 @@ export const api = {
   downloadReport(id: string): string {
     return `${BASE}/reports/${id}/download`;
   },
+
+  exportFindingsCsv(batchId: string): string {
+    return `${BASE}/batches/${batchId}/findings.csv`;
+  },
 };
@@ -81,7 +81,6 @@ export default function ReportsPage() {
             <tbody>
               {completedBatches.map((batch) => {
                 const pdfState = getReportState(batch.id, 'pdf');
-                const csvState = getReportState(batch.id, 'csv');
 
                 return (
                   <tr key={batch.id}>
@@ -97,11 +96,13 @@ export default function ReportsPage() {
                       />
                     </td>
                     <td>
-                      <ReportButton
-                        state={csvState}
-                        format="csv"
-                        onGenerate={() => handleGenerate(batch.id, 'csv')}
-                      />
+                      <a
+                        href={api.exportFindingsCsv(batch.id)}
+                        className="btn btn-secondary btn-sm"
+                        download
+                      >
+                        Download CSV
+                      </a>
                     </td>
                   </tr>
                 );
@@ -20,7 +20,7 @@ export interface Document {
 }
 
 export interface Finding {
-  id: string;
+  id: number;
   document_id: string;
   page_number: number;
   pii_type: string;
@@ -49,4 +49,5 @@ export interface PaginatedResponse<T> {
   total: number;
   page: number;
   page_size: number;
+  next_cursor?: string | null;
 }
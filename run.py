@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """RedactQC application entry point.
 
-Initializes the database, starts the FastAPI server on localhost,
+Starts the FastAPI server on localhost (which initializes the database)
 and opens the default browser to the dashboard.
 """
 
@@ -17,31 +17,55 @@ import sys
 multiprocessing.freeze_support()
 
 import threading
-import time
-import webbrowser
 
-import uvicorn
 
+def open_browser(host: str, port: int, timeout: float = 30.0) -> None:
+    """Open the default browser as soon as the server answers.
+
+    Polls the liveness endpoint every 100 ms from a daemon thread, so the
+    page opens when the app is serving rather than after a guessed delay.
+    spaCy warms up in the background and is not waited for.
+    """
 
-def open_browser(url: str, delay: float = 1.5) -> None:
-    """Open the default browser after a short delay."""
     def _open() -> None:
-        time.sleep(delay)
+        import http.client
+        import time
+        import webbrowser
+
+        url = f"http://{host}:{port}"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            # http.client rather than urllib: no system proxy for localhost
+            conn = http.client.HTTPConnection(host, port, timeout=1)
+            try:
+                conn.request("GET", "/api/health/live")
+                if conn.getresponse().status == 200:
+                    break
+            except (OSError, http.client.HTTPException):
+                pass
+            finally:
+                conn.close()
+            time.sleep(0.1)
+        else:
+            print(f"Server did not answer within {timeout:g}s; open {url} manually.")
+            return
         webbrowser.open(url)
-    threading.Thread(target=_open, daemon=True).start()
+
+    threading.Thread(target=_open, name="open-browser", daemon=True).start()
 
 
 def main() -> None:
-    # Lazy-import backend modules so worker child processes (handled by
-    # freeze_support above) never execute this code path.
+    # Lazy-import uvicorn and backend modules so worker child processes
+    # (handled by freeze_support above) never pay for them. Data directories
+    # and the database schema are set up by the app's lifespan handler.
+    import uvicorn
+
     from backend.core.config import settings
     from backend.core.database import db
 
-    # Ensure data directories exist
-    settings.ensure_dirs()
-
-    # Initialize database schema
-    db.initialize()
+    # Before any API worker starts, so no live report job can be swept
+    db.fail_interrupted_reports()
+    db.close()
 
     url = f"http://{settings.host}:{settings.port}"
     print(f"RedactQC starting at {url}")
@@ -49,7 +73,7 @@ def main() -> None:
 
     # Open browser
     if "--no-browser" not in sys.argv:
-        open_browser(url)
+        open_browser(settings.host, settings.port)
 
     # In frozen mode (PyInstaller), string-based app import fails —
     # pass the app object directly instead.
@@ -60,6 +84,10 @@ def main() -> None:
             host=settings.host,
             port=settings.port,
             log_level="info",
+            loop=settings.event_loop,
+            http="httptools",
+            limit_concurrency=settings.limit_concurrency,
+            timeout_keep_alive=settings.timeout_keep_alive,
         )
     else:
         uvicorn.run(
@@ -67,6 +95,11 @@ def main() -> None:
             host=settings.host,
             port=settings.port,
             log_level="info",
+            loop=settings.event_loop,
+            http="httptools",
+            workers=settings.api_workers,
+            limit_concurrency=settings.limit_concurrency,
+            timeout_keep_alive=settings.timeout_keep_alive,
         )
 
 
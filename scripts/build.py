@@ -9,6 +9,8 @@ Bundles the full RedactQC application including:
 - All required hidden imports for frozen execution
 """
 
+import fnmatch
+import hashlib
 import os
 import platform
 import shutil
@@ -20,16 +22,52 @@ ROOT = Path(__file__).resolve().parent.parent
 FRONTEND = ROOT / "frontend"
 BACKEND = ROOT / "backend"
 DIST = ROOT / "dist"
+HOOKS = Path(__file__).resolve().parent / "pyinstaller_hooks"
+
+
+# Files whose contents determine frontend/dist
+FRONTEND_INPUTS = (
+    "src/**/*",
+    "index.html",
+    "package.json",
+    "package-lock.json",
+    "tsconfig*.json",
+    "vite.config.ts",
+)
+
+
+def _fingerprint(root: Path, patterns: tuple[str, ...]) -> str:
+    """SHA-256 over the paths and contents of the files matching patterns."""
+    digest = hashlib.sha256()
+    files = {p for pattern in patterns for p in root.glob(pattern) if p.is_file()}
+    for path in sorted(files):
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
 
 
 def build_frontend() -> None:
-    """Build the React frontend."""
+    """Build the React frontend, unless dist/ was built from the same sources."""
     print("=== Building frontend ===")
     # shell=True needed on Windows so that npm.cmd is resolved via PATH
     use_shell = platform.system() == "Windows"
-    if not (FRONTEND / "node_modules").is_dir():
+
+    build_stamp = FRONTEND / "dist" / ".build_hash"
+    build_hash = _fingerprint(FRONTEND, FRONTEND_INPUTS)
+    if build_stamp.is_file() and build_stamp.read_text().strip() == build_hash:
+        print("[SKIP] Frontend up to date.")
+        return
+
+    # Reinstall when the lockfile changed since node_modules was populated
+    install_stamp = FRONTEND / "node_modules" / ".lock_hash"
+    lock_hash = _fingerprint(FRONTEND, ("package-lock.json",))
+    if not install_stamp.is_file() or install_stamp.read_text().strip() != lock_hash:
         subprocess.run(["npm", "install"], cwd=str(FRONTEND), check=True, shell=use_shell)
+        install_stamp.write_text(lock_hash)
+
     subprocess.run(["npm", "run", "build"], cwd=str(FRONTEND), check=True, shell=use_shell)
+    build_stamp.write_text(build_hash)
     print("Frontend built successfully.")
 
 
@@ -73,6 +111,12 @@ def build_executable() -> None:
         "pydantic.deprecated",
         # Not needed at runtime
         "pytest", "hypothesis", "IPython", "notebook", "tkinter",
+        # Optional backends thinc probes behind try/except, plus heavy
+        # packages a conda or data-science environment tends to drag in
+        "torch", "torchvision", "tensorflow", "mxnet", "cupy", "mkl",
+        "scipy", "pandas", "matplotlib", "sklearn",
+        "jupyter_client", "jupyter_core", "zmq",
+        "qtpy", "PyQt5", "PySide2", "PySide6",
     ]
 
     cmd = [
@@ -84,12 +128,16 @@ def build_executable() -> None:
         f"--distpath={DIST}",
         "--noconfirm",
         "--clean",
+        "--log-level=WARN",
+        # Bundle .pyc compiled with -O (asserts stripped). Not -OO: pydantic,
+        # FastAPI and spaCy read docstrings at runtime.
+        "--optimize=1",
         # ── Frontend ──────────────────────────────────────────────────────
         f"--add-data={frontend_dist}{sep}frontend/dist",
         # ── spaCy model data ─────────────────────────────────────────────
         "--collect-data=en_core_web_lg",
-        "--collect-data=spacy",
-        "--collect-data=thinc",
+        # spaCy and thinc data come from the trimmed hooks in pyinstaller_hooks/
+        f"--additional-hooks-dir={HOOKS}",
         "--hidden-import=en_core_web_lg",
         # spaCy core modules (not --collect-all which pulls in tests)
         "--hidden-import=spacy",
@@ -142,6 +190,8 @@ def build_executable() -> None:
         "--hidden-import=uvicorn.lifespan",
         "--hidden-import=uvicorn.lifespan.on",
         "--hidden-import=uvicorn.lifespan.off",
+        "--hidden-import=httptools",
+        "--hidden-import=uvloop",
         # ── FastAPI + Starlette ───────────────────────────────────────────
         "--hidden-import=fastapi",
         "--hidden-import=starlette",
@@ -149,6 +199,9 @@ def build_executable() -> None:
         "--hidden-import=starlette.routing",
         "--hidden-import=starlette.middleware",
         "--hidden-import=starlette.middleware.cors",
+        "--hidden-import=orjson",
+        # Route modules are registered through importlib in backend.api.main
+        "--collect-submodules=backend.api.routes",
         # ── Multiprocessing (Windows spawn) ───────────────────────────────
         "--hidden-import=multiprocessing",
         "--hidden-import=multiprocessing.pool",
@@ -163,6 +216,9 @@ def build_executable() -> None:
         # ── PDF handling ──────────────────────────────────────────────────
         "--hidden-import=fitz",
         "--hidden-import=pymupdf",
+        # ── PII detection ─────────────────────────────────────────────────
+        "--hidden-import=ahocorasick",
+        "--hidden-import=re2",
         # ── Async support ─────────────────────────────────────────────────
         "--hidden-import=aiofiles",
         "--hidden-import=aiofiles.os",
@@ -185,6 +241,17 @@ def build_executable() -> None:
     print(f"Executable built at: {DIST / 'RedactQC'}")
 
 
+def _bundle_files(build_dir: Path) -> dict[str, int]:
+    """Size of every file under build_dir, keyed by '/'-separated relative path."""
+    files: dict[str, int] = {}
+    for dirpath, _, filenames in os.walk(build_dir):
+        rel_dir = Path(dirpath).relative_to(build_dir).as_posix()
+        for name in filenames:
+            rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+            files[rel] = os.path.getsize(os.path.join(dirpath, name))
+    return files
+
+
 def verify_build() -> bool:
     """Check the build output contains critical files."""
     print("\n=== Verifying build ===")
@@ -195,68 +262,69 @@ def verify_build() -> bool:
         return False
 
     exe_name = "RedactQC.exe" if platform.system() == "Windows" else "RedactQC"
-    # PyInstaller 6.x puts --add-data assets under _internal/
-    search_dirs = [build_dir, build_dir / "_internal"]
+
+    # One walk of the bundle answers every check below; the tree holds tens
+    # of thousands of files, so walking it per check is what dominates.
+    files = _bundle_files(build_dir)
+
+    def found(pattern: str) -> bool:
+        # Leading '/' so "*/pkg/..." also matches a top-level pkg directory
+        return any(fnmatch.fnmatchcase(f"/{rel}", pattern) for rel in files)
 
     all_ok = True
 
     # Check executable
-    exe_path = build_dir / exe_name
-    if exe_path.exists():
+    if exe_name in files:
         print(f"  [OK] Executable: {exe_name}")
     else:
         print(f"  [MISSING] Executable: {exe_name}")
         all_ok = False
 
-    # Check frontend (could be at top level or under _internal)
-    frontend_found = False
-    for search_dir in search_dirs:
-        candidate = search_dir / "frontend" / "dist" / "index.html"
-        if candidate.exists():
-            print(f"  [OK] Frontend: {candidate.relative_to(build_dir)}")
-            frontend_found = True
+    # Check frontend (could be at top level or under _internal, where
+    # PyInstaller 6.x puts --add-data assets)
+    for candidate in ("frontend/dist/index.html", "_internal/frontend/dist/index.html"):
+        if candidate in files:
+            print(f"  [OK] Frontend: {candidate}")
             break
-    if not frontend_found:
+    else:
         print("  [MISSING] Frontend: frontend/dist/index.html")
         all_ok = False
 
-    # Check for spaCy model data
-    spacy_found = False
-    for search_dir in search_dirs:
-        if list(search_dir.rglob("en_core_web_lg/meta.json")):
-            spacy_found = True
-            break
-
-    # Check for Presidio config
-    presidio_found = False
-    for search_dir in search_dirs:
-        if list(search_dir.rglob("presidio_analyzer/conf*")):
-            presidio_found = True
-            break
-
-    if spacy_found:
+    if found("*/en_core_web_lg/meta.json"):
         print("  [OK] spaCy model (en_core_web_lg)")
     else:
         print("  [MISSING] spaCy model (en_core_web_lg) — PII detection will fail")
         all_ok = False
 
-    if presidio_found:
+    if found("*/presidio_analyzer/conf*"):
         print("  [OK] Presidio analyzer config")
     else:
         print("  [MISSING] Presidio analyzer config — PII detection may fail")
         all_ok = False
 
+    # The backend is bundled as bytecode in the PYZ archive; files under a
+    # backend/ directory mean it is also shipped a second time as data
+    if any(rel.startswith(("backend/", "_internal/backend/")) for rel in files):
+        print("  [DUPLICATE] backend/ bundled as data as well as bytecode")
+        all_ok = False
+
     # Check for bundled Tesseract
     tesseract_exe = "tesseract.exe" if platform.system() == "Windows" else "tesseract"
-    tesseract_bundled = list(build_dir.rglob(f"tesseract/{tesseract_exe}"))
-    if tesseract_bundled:
-        print(f"  [OK] Tesseract OCR bundled")
+    if found(f"*/tesseract/{tesseract_exe}"):
+        print("  [OK] Tesseract OCR bundled")
     else:
         print("  [INFO] Tesseract OCR not bundled — OCR requires separate install")
 
-    # Report size
-    total_size = sum(f.stat().st_size for f in build_dir.rglob("*") if f.is_file())
+    # Report size, with the largest top-level entries to guide the excludes
+    sizes: dict[str, int] = {}
+    for rel, size in files.items():
+        parts = rel.split("/")
+        top = parts[1] if parts[0] == "_internal" and len(parts) > 1 else parts[0]
+        sizes[top] = sizes.get(top, 0) + size
+    total_size = sum(sizes.values())
     print(f"\n  Total build size: {total_size / (1024 * 1024):.0f} MB")
+    for name, size in sorted(sizes.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"    {size / (1024 * 1024):7.1f} MB  {name}")
 
     return all_ok
 
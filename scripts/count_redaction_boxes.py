@@ -8,11 +8,20 @@ import numpy as np
 import fitz  # PyMuPDF
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
 
 def _compute_rectangularity(labels, label_id, stats):
     """Compute how rectangular a connected component is using minAreaRect."""
-    mask = (labels == label_id).astype(np.uint8)
+    # Mask only the component's bounding box, with a one-pixel empty border so
+    # the contour is traced exactly as on a full-page mask
+    x = stats[label_id, cv2.CC_STAT_LEFT]
+    y = stats[label_id, cv2.CC_STAT_TOP]
+    w = stats[label_id, cv2.CC_STAT_WIDTH]
+    h = stats[label_id, cv2.CC_STAT_HEIGHT]
+    mask = np.zeros((h + 2, w + 2), np.uint8)
+    mask[1:-1, 1:-1] = labels[y:y + h, x:x + w] == label_id
     contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
     if not contours:
         return 0.0
@@ -27,44 +36,323 @@ def _compute_rectangularity(labels, label_id, stats):
     return comp_area / rect_area
 
 
-def _is_text_neighbor(candidate, all_components, stats):
+def _label_components(binary):
+    """
+    8-connected component labels and stats of a binary page.
+
+    BBDT with 16-bit labels is about twice as fast as the default call; a
+    page with more than 65535 components (heavy speckle) is relabeled with
+    32-bit labels instead.
+    """
+    try:
+        return cv2.connectedComponentsWithStatsWithAlgorithm(
+            binary, 8, cv2.CV_16U, cv2.CCL_BBDT
+        )
+    except cv2.error:
+        return cv2.connectedComponentsWithStatsWithAlgorithm(
+            binary, 8, cv2.CV_32S, cv2.CCL_BBDT
+        )
+
+
+# Pixel thresholds below are tuned for 300 dpi renders
+BASE_DPI = 300
+
+
+def _scaled(pixels, scale, dims=1):
+    """Scale a 300 dpi pixel length (dims=1) or area (dims=2) to the render dpi."""
+    return round(pixels * scale ** dims)
+
+
+def _line_components(stats, scale=1.0):
+    """
+    Position arrays of the non-noise components on a page, for
+    _is_text_neighbor: (left, top, center x, center y).
+    """
+    comp = stats[1:]  # skip background label 0
+    comp = comp[comp[:, cv2.CC_STAT_AREA] >= _scaled(30, scale, 2)]  # skip tiny noise
+    sx = comp[:, cv2.CC_STAT_LEFT]
+    sy = comp[:, cv2.CC_STAT_TOP]
+    scx = sx + comp[:, cv2.CC_STAT_WIDTH] // 2
+    scy = sy + comp[:, cv2.CC_STAT_HEIGHT] // 2
+    return sx, sy, scx, scy
+
+
+def _is_text_neighbor(candidate, components, scale=1.0):
     """
     Check if a small candidate is part of a text line.
     A component surrounded by many similarly-sized dark components
     at the same vertical position is likely a text character.
+
+    ``components`` comes from _line_components for the candidate's page.
     """
+    sx, sy, scx, scy = components
     cy = candidate["y"] + candidate["h"] // 2
     cx = candidate["x"] + candidate["w"] // 2
-    y_tolerance = max(candidate["h"], 20)  # same line = similar y
-
-    neighbors = 0
-    for i in range(1, len(stats)):
-        sx = stats[i, cv2.CC_STAT_LEFT]
-        sy = stats[i, cv2.CC_STAT_TOP]
-        sw = stats[i, cv2.CC_STAT_WIDTH]
-        sh = stats[i, cv2.CC_STAT_HEIGHT]
-        sa = stats[i, cv2.CC_STAT_AREA]
-        scy = sy + sh // 2
-
-        if sa < 30:  # skip tiny noise
-            continue
-        # Same horizontal band?
-        if abs(scy - cy) > y_tolerance:
-            continue
-        # Not counting itself (by position)
-        if sx == candidate["x"] and sy == candidate["y"]:
+    y_tolerance = max(candidate["h"], _scaled(20, scale))  # same line = similar y
+
+    # Same horizontal band, nearby horizontally (within ~1 inch), and not the
+    # candidate itself (by position)
+    near = (np.abs(scy - cy) <= y_tolerance) & (np.abs(scx - cx) < _scaled(300, scale))
+    near &= (sx != candidate["x"]) | (sy != candidate["y"])
+
+    return np.count_nonzero(near) >= 4  # 4+ nearby dark items = likely text line
+
+
+# Page-sized work buffers, reused while consecutive pages keep the same size
+_buffers = {}
+
+
+def _page_buffers(h, w):
+    """Return (gray, binary, opened) uint8 buffers for an h x w page."""
+    if _buffers.get("shape") != (h, w):
+        _buffers["shape"] = (h, w)
+        _buffers["arrays"] = tuple(np.empty((h, w), np.uint8) for _ in range(3))
+    return _buffers["arrays"]
+
+
+def _process_page(doc, page_num, pdf_path, dpi, debug_dir, dark_thresh,
+                  min_fill, min_area, min_minor, min_major, keep_rejected):
+    """
+    Detect the redaction boxes on one page of an open document.
+
+    Takes the iter_pages parameters and returns (boxes, rejected) for the
+    page; rejected is empty unless keep_rejected is set.
+    """
+    scale = dpi / BASE_DPI
+    min_area = _scaled(min_area, scale, 2)
+    min_minor = _scaled(min_minor, scale)
+    min_major = _scaled(min_major, scale)
+    thin_minor = _scaled(3, scale)
+    thin_major = _scaled(80, scale)
+    small_area = _scaled(800, scale, 2)
+    small_minor = _scaled(25, scale)
+
+    page = doc[page_num]
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    pix = page.get_pixmap(matrix=mat)
+    # samples_mv views the pixmap's memory; samples would copy it to bytes
+    img_array = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(
+        pix.h, pix.w, pix.n
+    )
+    gray, binary, opened = _page_buffers(pix.h, pix.w)
+
+    # One conversion straight to gray; same pixels as going through BGR
+    if pix.n == 4:
+        cv2.cvtColor(img_array, cv2.COLOR_RGBA2GRAY, dst=gray)
+    elif pix.n == 3:
+        cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY, dst=gray)
+    else:
+        gray = img_array.reshape(pix.h, pix.w)
+
+    # Binary threshold: pixels darker than dark_thresh become white (foreground)
+    cv2.threshold(gray, dark_thresh, 255, cv2.THRESH_BINARY_INV, dst=binary)
+
+    # Minimal opening to remove 1-2 pixel noise specks
+    # Do NOT use closing - that would merge adjacent boxes
+    kernel_open = np.ones((2, 2), np.uint8)
+    cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_open, dst=opened)
+
+    # Connected components analysis
+    num_labels, labels, stats, centroids = _label_components(opened)
+
+    # First pass: basic size/fill filter, evaluated for all components
+    # at once on the stats columns (label 0 is the background)
+    comp = stats[1:]
+    xs = comp[:, cv2.CC_STAT_LEFT]
+    ys = comp[:, cv2.CC_STAT_TOP]
+    ws = comp[:, cv2.CC_STAT_WIDTH]
+    hs = comp[:, cv2.CC_STAT_HEIGHT]
+    areas = comp[:, cv2.CC_STAT_AREA]
+    bbox_areas = ws * hs
+    fills = np.divide(areas, bbox_areas, out=np.zeros(len(comp)), where=bbox_areas > 0)
+    minors = np.minimum(ws, hs)
+    majors = np.maximum(ws, hs)
+    # First failing check per component, 0 if it passes them all
+    reject_codes = np.select(
+        [
+            areas < min_area,
+            minors < min_minor,
+            majors < min_major,
+            fills < min_fill,
+            # Very thin long lines are borders/rules, not redaction boxes
+            (minors <= thin_minor) & (majors > thin_major),
+        ],
+        [1, 2, 3, 4, 5],
+        default=0,
+    )
+
+    # Rejected dicts are needed for the result or the debug overlay only;
+    # otherwise the loop below sees just the candidates
+    collect_rejected = keep_rejected or bool(debug_dir)
+    label_ids = np.arange(1, num_labels)
+    if not collect_rejected:
+        keep = reject_codes == 0
+        label_ids, xs, ys, ws, hs, areas, fills, reject_codes = (
+            a[keep] for a in (label_ids, xs, ys, ws, hs, areas, fills, reject_codes)
+        )
+
+    candidates = []
+    rejected = []
+
+    for label, x, y, w, h, area, fill, code in zip(
+        label_ids.tolist(), xs.tolist(), ys.tolist(), ws.tolist(), hs.tolist(),
+        areas.tolist(), fills.tolist(), reject_codes.tolist(),
+    ):
+        if code == 0:
+            candidates.append({
+                "x": x, "y": y, "w": w, "h": h,
+                "area": area, "fill": fill,
+                "label": label,
+            })
             continue
-        # Nearby horizontally (within ~300px = ~1 inch at 300dpi)
-        scx = sx + sw // 2
-        if abs(scx - cx) < 300:
-            neighbors += 1
 
-    return neighbors >= 4  # 4+ nearby dark items = likely text line
+        if code == 1:
+            reason = f"area={area}<{min_area}"
+        elif code == 2:
+            reason = f"minor={min(w, h)}<{min_minor}"
+        elif code == 3:
+            reason = f"major={max(w, h)}<{min_major}"
+        elif code == 4:
+            reason = f"fill={fill:.3f}<{min_fill}"
+        else:
+            reason = f"thin_line={w}x{h}"
+        rejected.append({
+            "x": x, "y": y, "w": w, "h": h,
+            "area": area, "fill": fill, "reason": reason,
+            "label": label,
+        })
+
+    # Second pass: rectangularity + text-line check on candidates
+    boxes = []
+    line_components = None
+    for c in candidates:
+        reason = None
+
+        # Rectangularity check: how close to a perfect rectangle?
+        rect_score = _compute_rectangularity(labels, c["label"], stats)
+        c["rect"] = rect_score
+
+        if rect_score < 0.82:
+            reason = f"rect={rect_score:.3f}<0.82"
+        # For small components, also check if they're in a text line
+        elif c["area"] < small_area and min(c["w"], c["h"]) < small_minor:
+            if line_components is None:
+                line_components = _line_components(stats, scale)
+            if _is_text_neighbor(c, line_components, scale):
+                reason = f"text_context(area={c['area']},min={min(c['w'],c['h'])})"
+
+        if not reason:
+            boxes.append(c)
+        elif collect_rejected:
+            rejected.append({
+                "x": c["x"], "y": c["y"], "w": c["w"], "h": c["h"],
+                "area": c["area"], "fill": c["fill"], "reason": reason,
+                "label": c["label"],
+            })
+
+    if debug_dir:
+        os.makedirs(debug_dir, exist_ok=True)
+        # Color copy of the page for the overlay, only made when it is saved
+        if pix.n == 4:
+            debug_img = cv2.cvtColor(img_array, cv2.COLOR_RGBA2BGR)
+        elif pix.n == 3:
+            debug_img = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
+        else:
+            debug_img = cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
+
+        # Draw accepted boxes in green with numbers
+        for j, b in enumerate(boxes):
+            cv2.rectangle(
+                debug_img,
+                (b["x"], b["y"]),
+                (b["x"] + b["w"], b["y"] + b["h"]),
+                (0, 255, 0), 2,
+            )
+            label = f'{j + 1}'
+            cv2.putText(
+                debug_img, label,
+                (b["x"], b["y"] - 4),
+                cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 200, 0), 1,
+            )
+
+        # Draw rejected candidates in red (only significant ones)
+        for r in rejected:
+            if r["area"] > 50:
+                cv2.rectangle(
+                    debug_img,
+                    (r["x"], r["y"]),
+                    (r["x"] + r["w"], r["y"] + r["h"]),
+                    (0, 0, 255), 1,
+                )
+
+        stem = os.path.splitext(os.path.basename(pdf_path))[0]
+        # Shorten the name for readability
+        if "Easy" in pdf_path or "Deidentification_0" in stem:
+            tag = "easy"
+        elif "Medium" in pdf_path or "Medium" in stem:
+            tag = "medium"
+        elif "Hard" in pdf_path or "Hard" in stem:
+            tag = "hard"
+        else:
+            tag = stem[:20]
+
+        out_path = os.path.join(debug_dir, f"{tag}_p{page_num + 1}.png")
+        cv2.imwrite(out_path, debug_img)
+
+    return boxes, rejected if keep_rejected else []
+
+
+# PyMuPDF documents cannot be shared across processes; each worker opens its own
+_worker_doc = None
+
+
+def _open_worker_doc(pdf_path):
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+
+
+def _process_worker_page(page_num, pdf_path, params):
+    return _process_page(_worker_doc, page_num, pdf_path, *params)
+
+
+def iter_pages(pdf_path, dpi=300, debug_dir=None,
+               dark_thresh=70, min_fill=0.78, min_area=150,
+               min_minor=5, min_major=15, workers=None, keep_rejected=True):
+    """
+    Yield (boxes, rejected) for each page of a scanned PDF, in page order.
+
+    Takes the count_redaction_boxes parameters. Pages are produced as they
+    finish, so callers that do not keep them hold one page at a time;
+    keep_rejected=False also skips building the rejected list.
+    """
+    params = (dpi, debug_dir, dark_thresh, min_fill, min_area, min_minor, min_major,
+              keep_rejected)
+
+    doc = fitz.open(pdf_path)
+    try:
+        page_total = len(doc)
+        workers = min(workers or os.cpu_count() or 1, page_total)
+        if workers <= 1:
+            for page_num in range(page_total):
+                yield _process_page(doc, page_num, pdf_path, *params)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_open_worker_doc,
+                initargs=(pdf_path,),
+            ) as executor:
+                yield from executor.map(
+                    partial(_process_worker_page, pdf_path=pdf_path, params=params),
+                    range(page_total),
+                )
+    finally:
+        doc.close()
 
 
 def count_redaction_boxes(pdf_path, dpi=300, debug_dir=None,
                           dark_thresh=70, min_fill=0.78, min_area=150,
-                          min_minor=5, min_major=15):
+                          min_minor=5, min_major=15, workers=None,
+                          keep_rejected=True):
     """
     Count solid black redaction boxes in a scanned PDF.
 
@@ -74,157 +362,27 @@ def count_redaction_boxes(pdf_path, dpi=300, debug_dir=None,
     2. Rectangularity check via minAreaRect
     3. Text-line context check (characters cluster on same baseline)
 
+    Pixel sizes (min_area, min_minor, min_major and the internal limits) are
+    given for 300 dpi and scaled to ``dpi``, so a 150 dpi render keeps the
+    same physical thresholds at a quarter of the pixels.
+
+    Pages are independent and run in ``workers`` processes (default: one
+    per CPU), each with its own handle on the PDF; workers=1 runs them in
+    this process. With keep_rejected=False the per-page "rejected" lists
+    are left empty, which saves a dict per dark component on the page.
+
     Returns:
         (total_count, per_page_counts, per_page_details)
     """
-    doc = fitz.open(pdf_path)
-    total = 0
     page_counts = []
     page_details = []
-
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        mat = fitz.Matrix(dpi / 72, dpi / 72)
-        pix = page.get_pixmap(matrix=mat)
-        img_array = np.frombuffer(pix.samples, dtype=np.uint8).reshape(
-            pix.h, pix.w, pix.n
-        )
-
-        if pix.n == 4:
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGBA2BGR)
-        elif pix.n == 3:
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-        else:
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_GRAY2BGR)
-
-        gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-
-        # Binary threshold: pixels darker than dark_thresh become white (foreground)
-        _, binary = cv2.threshold(gray, dark_thresh, 255, cv2.THRESH_BINARY_INV)
-
-        # Minimal opening to remove 1-2 pixel noise specks
-        # Do NOT use closing - that would merge adjacent boxes
-        kernel_open = np.ones((2, 2), np.uint8)
-        binary = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel_open)
-
-        # Connected components analysis
-        num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(binary)
-
-        # First pass: basic size/fill filter
-        candidates = []
-        rejected = []
-
-        for i in range(1, num_labels):  # skip background label 0
-            x = stats[i, cv2.CC_STAT_LEFT]
-            y = stats[i, cv2.CC_STAT_TOP]
-            w = stats[i, cv2.CC_STAT_WIDTH]
-            h = stats[i, cv2.CC_STAT_HEIGHT]
-            area = stats[i, cv2.CC_STAT_AREA]
-            bbox_area = w * h
-            fill = area / bbox_area if bbox_area > 0 else 0
-
-            reason = None
-
-            if area < min_area:
-                reason = f"area={area}<{min_area}"
-            elif min(w, h) < min_minor:
-                reason = f"minor={min(w, h)}<{min_minor}"
-            elif max(w, h) < min_major:
-                reason = f"major={max(w, h)}<{min_major}"
-            elif fill < min_fill:
-                reason = f"fill={fill:.3f}<{min_fill}"
-            # Very thin long lines are borders/rules, not redaction boxes
-            elif min(w, h) <= 3 and max(w, h) > 80:
-                reason = f"thin_line={w}x{h}"
-
-            if reason:
-                rejected.append({
-                    "x": x, "y": y, "w": w, "h": h,
-                    "area": area, "fill": fill, "reason": reason,
-                    "label": i,
-                })
-            else:
-                candidates.append({
-                    "x": x, "y": y, "w": w, "h": h,
-                    "area": area, "fill": fill,
-                    "label": i,
-                })
-
-        # Second pass: rectangularity + text-line check on candidates
-        boxes = []
-        for c in candidates:
-            reason = None
-
-            # Rectangularity check: how close to a perfect rectangle?
-            rect_score = _compute_rectangularity(labels, c["label"], stats)
-            c["rect"] = rect_score
-
-            if rect_score < 0.82:
-                reason = f"rect={rect_score:.3f}<0.82"
-            # For small components, also check if they're in a text line
-            elif c["area"] < 800 and min(c["w"], c["h"]) < 25:
-                if _is_text_neighbor(c, None, stats):
-                    reason = f"text_context(area={c['area']},min={min(c['w'],c['h'])})"
-
-            if reason:
-                rejected.append({
-                    "x": c["x"], "y": c["y"], "w": c["w"], "h": c["h"],
-                    "area": c["area"], "fill": c["fill"], "reason": reason,
-                    "label": c["label"],
-                })
-            else:
-                boxes.append(c)
-
-        count = len(boxes)
-        total += count
-        page_counts.append(count)
+    for boxes, rejected in iter_pages(
+        pdf_path, dpi, debug_dir, dark_thresh, min_fill, min_area,
+        min_minor, min_major, workers, keep_rejected,
+    ):
+        page_counts.append(len(boxes))
         page_details.append({"boxes": boxes, "rejected": rejected})
-
-        if debug_dir:
-            os.makedirs(debug_dir, exist_ok=True)
-            debug_img = img_bgr.copy()
-
-            # Draw accepted boxes in green with numbers
-            for j, b in enumerate(boxes):
-                cv2.rectangle(
-                    debug_img,
-                    (b["x"], b["y"]),
-                    (b["x"] + b["w"], b["y"] + b["h"]),
-                    (0, 255, 0), 2,
-                )
-                label = f'{j + 1}'
-                cv2.putText(
-                    debug_img, label,
-                    (b["x"], b["y"] - 4),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (0, 200, 0), 1,
-                )
-
-            # Draw rejected candidates in red (only significant ones)
-            for r in rejected:
-                if r["area"] > 50:
-                    cv2.rectangle(
-                        debug_img,
-                        (r["x"], r["y"]),
-                        (r["x"] + r["w"], r["y"] + r["h"]),
-                        (0, 0, 255), 1,
-                    )
-
-            stem = os.path.splitext(os.path.basename(pdf_path))[0]
-            # Shorten the name for readability
-            if "Easy" in pdf_path or "Deidentification_0" in stem:
-                tag = "easy"
-            elif "Medium" in pdf_path or "Medium" in stem:
-                tag = "medium"
-            elif "Hard" in pdf_path or "Hard" in stem:
-                tag = "hard"
-            else:
-                tag = stem[:20]
-
-            out_path = os.path.join(debug_dir, f"{tag}_p{page_num + 1}.png")
-            cv2.imwrite(out_path, debug_img)
-
-    doc.close()
-    return total, page_counts, page_details
+    return sum(page_counts), page_counts, page_details
 
 
 def main():
@@ -0,0 +1,16 @@
+"""Slimmer replacement for the contrib spaCy hook.
+
+The contrib hook bundles every non-.py file in spaCy, which is mostly the
+Cython sources and headers it was compiled from, plus the test suite.
+Only the config files are read at runtime.
+"""
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+
+SOURCE_EXCLUDES = [
+    "**/*.pyx", "**/*.pxd", "**/*.pyi", "**/*.c", "**/*.cpp", "**/*.h", "**/*.hh",
+    "tests/**", "**/tests/**",
+]
+
+datas = collect_data_files("spacy", excludes=SOURCE_EXCLUDES)
+hiddenimports = collect_submodules("spacy", filter=lambda name: "tests" not in name.split("."))
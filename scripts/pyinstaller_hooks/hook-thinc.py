@@ -0,0 +1,15 @@
+"""Slimmer replacement for the contrib thinc hook.
+
+Skips thinc's Cython sources and tests. The .cu kernel sources stay:
+thinc.backends._custom_kernels reads them at import, GPU or not.
+"""
+
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+
+SOURCE_EXCLUDES = [
+    "**/*.pyx", "**/*.pxd", "**/*.pyi", "**/*.c", "**/*.cpp", "**/*.h", "**/*.hh",
+    "tests/**", "**/tests/**",
+]
+
+datas = collect_data_files("thinc", excludes=SOURCE_EXCLUDES)
+hiddenimports = collect_submodules("thinc", filter=lambda name: "tests" not in name.split("."))